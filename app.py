@@ -4,14 +4,18 @@ Sportspuff-v6 Web Application
 Flask-based CRUD interface for managing teams and stadiums
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory, Response
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_from_directory, Response, g, has_app_context
 from flask_cors import CORS
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 import os
 import json
 import csv
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import threading
 import time
@@ -34,7 +38,27 @@ _refresh_locks = {}
 _cache_ttl = {
     'schedule': 300,  # 5 minutes for schedules
     'scores': 61,     # 61 seconds - background thread refreshes every 60s
+    'catalog': 600,   # 10 minutes for league/division lookups
+    'team_colors': 3600,  # 1 hour - colors change between seasons, not games
 }
+# Expired entries are only served stale while younger than this many TTLs;
+# past that a request blocks on a fresh fetch instead
+_MAX_STALE_TTL_MULTIPLE = 2
+
+# Shared HTTP session so upstream API calls reuse keep-alive connections
+# instead of paying a fresh TCP + TLS handshake on every request.
+SESSION = requests.Session()
+_session_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+)
+SESSION.mount('https://', _session_adapter)
+SESSION.mount('http://', _session_adapter)
+# Upstream hosts that cannot even accept a connection should fail fast so the
+# fallback host is tried before the request thread is pinned for the full
+# read timeout.
+UPSTREAM_CONNECT_TIMEOUT = 3.05
 
 WC_TEAM_CODES_BY_NAME = {
     'Algeria': 'alg',
@@ -205,6 +229,44 @@ def _read_csv_rows(filename):
         return tuple(dict(row) for row in csv.DictReader(handle))
 
 
+# City prefixes that scoreboards abbreviate; team color lookups accept either form
+CITY_NAME_ALIASES = (
+    ('Los Angeles', 'LA'),
+    ('New York', 'NY'),
+    ('San Francisco', 'SF'),
+)
+
+NFL_TEAMS_BY_ABBREV = {
+    'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons', 'BAL': 'Baltimore Ravens',
+    'BUF': 'Buffalo Bills', 'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns', 'DAL': 'Dallas Cowboys',
+    'DEN': 'Denver Broncos', 'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts', 'JAX': 'Jacksonville Jaguars',
+    'KC': 'Kansas City Chiefs', 'LV': 'Las Vegas Raiders', 'LAC': 'Los Angeles Chargers',
+    'LAR': 'Los Angeles Rams', 'MIA': 'Miami Dolphins', 'MIN': 'Minnesota Vikings',
+    'NE': 'New England Patriots', 'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
+    'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles', 'PIT': 'Pittsburgh Steelers',
+    'SF': 'San Francisco 49ers', 'SEA': 'Seattle Seahawks', 'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans', 'WSH': 'Washington Commanders', 'WAS': 'Washington Commanders',
+}
+NFL_ABBREVS_BY_TEAM = {
+    team_name: tuple(abbrev for abbrev, name in NFL_TEAMS_BY_ABBREV.items() if name == team_name)
+    for team_name in NFL_TEAMS_BY_ABBREV.values()
+}
+
+
+@lru_cache(maxsize=512)
+def _team_name_aliases(real_name):
+    """Return the long/short city variants of a team name (e.g. LA Clippers <-> Los Angeles Clippers)."""
+    aliases = []
+    for long_city, short_city in CITY_NAME_ALIASES:
+        if long_city in real_name:
+            aliases.append(real_name.replace(long_city, short_city))
+        elif real_name.startswith(f'{short_city} '):
+            aliases.append(real_name.replace(f'{short_city} ', f'{long_city} '))
+    return tuple(aliases)
+
+
 def _build_team_colors(rows):
     team_colors = {}
     for team in rows:
@@ -236,38 +298,14 @@ def _build_team_colors(rows):
         if full_name and full_name != real_name:
             team_colors[league_proper][full_name] = team_data
 
-        if 'Los Angeles' in real_name:
-            team_colors[league_proper][real_name.replace('Los Angeles', 'LA')] = team_data
-        elif real_name.startswith('LA '):
-            team_colors[league_proper][real_name.replace('LA ', 'Los Angeles ')] = team_data
-
-        if 'New York' in real_name:
-            team_colors[league_proper][real_name.replace('New York', 'NY')] = team_data
-        elif real_name.startswith('NY '):
-            team_colors[league_proper][real_name.replace('NY ', 'New York ')] = team_data
-
-        if 'San Francisco' in real_name:
-            team_colors[league_proper][real_name.replace('San Francisco', 'SF')] = team_data
-        elif real_name.startswith('SF '):
-            team_colors[league_proper][real_name.replace('SF ', 'San Francisco ')] = team_data
+        for alias in _team_name_aliases(real_name):
+            team_colors[league_proper][alias] = team_data
 
         if league_proper == 'NFL':
-            nfl_abbrev_map = {
-                'ARI': 'Arizona Cardinals', 'ATL': 'Atlanta Falcons', 'BAL': 'Baltimore Ravens',
-                'BUF': 'Buffalo Bills', 'CAR': 'Carolina Panthers', 'CHI': 'Chicago Bears',
-                'CIN': 'Cincinnati Bengals', 'CLE': 'Cleveland Browns', 'DAL': 'Dallas Cowboys',
-                'DEN': 'Denver Broncos', 'DET': 'Detroit Lions', 'GB': 'Green Bay Packers',
-                'HOU': 'Houston Texans', 'IND': 'Indianapolis Colts', 'JAX': 'Jacksonville Jaguars',
-                'KC': 'Kansas City Chiefs', 'LV': 'Las Vegas Raiders', 'LAC': 'Los Angeles Chargers',
-                'LAR': 'Los Angeles Rams', 'MIA': 'Miami Dolphins', 'MIN': 'Minnesota Vikings',
-                'NE': 'New England Patriots', 'NO': 'New Orleans Saints', 'NYG': 'New York Giants',
-                'NYJ': 'New York Jets', 'PHI': 'Philadelphia Eagles', 'PIT': 'Pittsburgh Steelers',
-                'SF': 'San Francisco 49ers', 'SEA': 'Seattle Seahawks', 'TB': 'Tampa Bay Buccaneers',
-                'TEN': 'Tennessee Titans', 'WSH': 'Washington Commanders', 'WAS': 'Washington Commanders',
-            }
-            for abbrev_key, mapped_name in nfl_abbrev_map.items():
-                if mapped_name != real_name and mapped_name != full_name:
-                    continue
+            nfl_abbrevs = NFL_ABBREVS_BY_TEAM.get(real_name, ())
+            if full_name != real_name:
+                nfl_abbrevs += NFL_ABBREVS_BY_TEAM.get(full_name, ())
+            for abbrev_key in nfl_abbrevs:
                 team_colors[league_proper][abbrev_key] = team_data
                 team_name_only = real_name.split()[-1] if real_name else ''
                 if not team_name_only:
@@ -421,14 +459,17 @@ def _fallback_catalog():
         'teams_by_stadium': teams_by_stadium,
     }
 
-def get_cached_response(cache_key, cache_type, allow_expired=False):
-    """Get cached response if still valid, or expired if allow_expired=True"""
+def get_cached_response(cache_key, cache_type, allow_expired=False, max_stale=None):
+    """Get cached response if still valid, or expired if allow_expired=True
+
+    max_stale (seconds) bounds how old an expired entry may be.
+    """
     with _api_cache_lock:
         if cache_key in _api_cache:
             cached_data, timestamp = _api_cache[cache_key]
             ttl = _cache_ttl.get(cache_type, 60)
             age = (datetime.now(timezone.utc) - timestamp).total_seconds()
-            if age < ttl or allow_expired:
+            if age < ttl or (allow_expired and (max_stale is None or age <= max_stale)):
                 return cached_data
     return None
 
@@ -448,6 +489,60 @@ def get_cached_response_entry(cache_key):
         return _api_cache.get(cache_key)
 
 
+def _cacheable_json(payload, max_age):
+    """jsonify payload with Cache-Control and an ETag, answering 304 when the client copy matches."""
+    response = jsonify(payload)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _encode_json(payload):
+    """Compact JSON bytes for hand-built responses (Decimal/datetime fall back to str)."""
+    return json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _json_response(payload, status=200):
+    """Uncached JSON response that skips jsonify's key sorting and pretty-print checks."""
+    return Response(_encode_json(payload), status=status, mimetype='application/json')
+
+
+# Encoded bodies for cached proxy payloads, keyed by cache key and tied to the
+# cache entry's timestamp so a refresh invalidates them.
+_encoded_responses = {}
+_MAX_ENCODED_RESPONSE_BYTES = 1024 * 1024
+
+
+def _cached_json_response(cache_key, payload, max_age):
+    """Serve a cached proxy payload, JSON-encoding and hashing it once per cache write."""
+    entry = get_cached_response_entry(cache_key)
+    version = entry[1] if entry and entry[0] is payload else None
+    with _api_cache_lock:
+        encoded = _encoded_responses.get(cache_key)
+    if version is not None and encoded and encoded[0] == version:
+        _, body, etag = encoded
+    else:
+        body = _encode_json(payload)
+        etag = hashlib.md5(body).hexdigest()
+        # Oversized payloads are re-encoded per hit to keep memory bounded
+        if version is not None and len(body) <= _MAX_ENCODED_RESPONSE_BYTES:
+            with _api_cache_lock:
+                _encoded_responses[cache_key] = (version, body, etag)
+                for stale_key in [key for key in _encoded_responses if key not in _api_cache]:
+                    del _encoded_responses[stale_key]
+    return _json_bytes_response(body, etag, max_age)
+
+
+def _json_bytes_response(body, etag, max_age):
+    """Serve a pre-encoded JSON body with a precomputed ETag, answering 304 when it matches."""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
 def _response_freshness_key(payload):
     """Return a freshness token for cached API payloads."""
     if not isinstance(payload, dict):
@@ -604,7 +699,9 @@ def _fetch_api_json(path, timeout=15, api_base_url=None):
     for api_base in _configured_api_base_urls(api_base_url):
         url = f"{api_base}{path}"
         try:
-            response = requests.get(url, timeout=timeout, verify=True, allow_redirects=True)
+            response = SESSION.get(
+                url, timeout=(UPSTREAM_CONNECT_TIMEOUT, timeout), verify=True, allow_redirects=True
+            )
             if response.status_code == 200:
                 return response.json()
             last_error = requests.exceptions.HTTPError(
@@ -635,7 +732,7 @@ def _fetch_api_json_from_candidates(paths, timeout=15, api_base_url=None):
 
 def _empty_all_scores_response():
     leagues = ['mlb', 'nba', 'nfl', 'nhl', 'mls', 'wnba', 'ipl', 'mlc', 'wc', 'atp', 'wta', 'cycling']
-    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    today = _iso_today()
     return {
         lg: {
             'schedule': {'date': today, 'games': []},
@@ -722,10 +819,75 @@ def _refresh_cache_async(cache_key, refresh_func):
     threading.Thread(target=refresh_and_release, daemon=True).start()
 
 
+def _refresh_proxy_cache(cache_key, path, timeout=20):
+    """Fetch an upstream payload and store it under cache_key unless it is an API error."""
+    data = _fetch_api_json(path, timeout=timeout)
+    if isinstance(data, dict) and 'error' in data:
+        logger.warning(f"Background refresh of {path} returned API error: {data['error']}")
+        return None
+    set_cached_response(cache_key, data)
+    return data
+
+
+_inflight_fetches = {}
+_inflight_fetches_lock = threading.Lock()
+
+
+def _fetch_proxy_payload(cache_key, cache_type, path, timeout=20):
+    """Fetch an upstream payload once per cache key, however many requests miss at once.
+
+    The first caller fetches and caches the payload; concurrent callers for the
+    same key wait for it and read the cache instead of hitting the API again.
+    API error payloads are returned but not cached.
+    """
+    with _inflight_fetches_lock:
+        event = _inflight_fetches.get(cache_key)
+        is_leader = event is None
+        if is_leader:
+            event = threading.Event()
+            _inflight_fetches[cache_key] = event
+
+    if not is_leader:
+        event.wait(timeout)
+        cached = get_cached_response(cache_key, cache_type)
+        if cached is not None:
+            return cached
+        raise requests.exceptions.RequestException(f"Coalesced fetch of {path} did not produce a payload")
+
+    try:
+        data = _fetch_api_json(path, timeout=timeout)
+        if not (isinstance(data, dict) and 'error' in data):
+            set_cached_response(cache_key, data)
+        return data
+    finally:
+        with _inflight_fetches_lock:
+            _inflight_fetches.pop(cache_key, None)
+        event.set()
+
+
+def _serve_stale_while_refreshing(cache_key, cache_type, path, timeout=20):
+    """Return an expired cached payload immediately and refresh it in the background.
+
+    Keeps request workers from blocking on upstream latency once a key has been
+    fetched at least once. Returns None when there is nothing cached, when the
+    entry is older than _MAX_STALE_TTL_MULTIPLE TTLs (e.g. refreshes kept
+    failing), or when background refresh is disabled, so callers fall through
+    to a blocking fetch.
+    """
+    if os.getenv('DISABLE_BACKGROUND_CACHE_REFRESH') == '1':
+        return None
+    max_stale = _MAX_STALE_TTL_MULTIPLE * _cache_ttl.get(cache_type, 60)
+    expired_cache = get_cached_response(cache_key, cache_type, allow_expired=True, max_stale=max_stale)
+    if not expired_cache:
+        return None
+    _refresh_cache_async(cache_key, lambda: _refresh_proxy_cache(cache_key, path, timeout=timeout))
+    return expired_cache
+
+
 def _fetch_nhl_playoff_series():
     """Fetch NHL playoff series (no Flask request context needed)."""
     try:
-        response = requests.get('https://api-web.nhle.com/v1/schedule/now', timeout=10)
+        response = SESSION.get('https://api-web.nhle.com/v1/schedule/now', timeout=10)
         response.raise_for_status()
         data = response.json()
         series_map = {}
@@ -756,7 +918,7 @@ def _fetch_nhl_playoff_series():
 def _fetch_mls_standings(api_base_url):
     """Fetch MLS standings (no Flask request context needed)."""
     try:
-        response = requests.get(f'{api_base_url}/api/v1/standings/mls', timeout=10)
+        response = SESSION.get(f'{api_base_url}/api/v1/standings/mls', timeout=10)
         if response.status_code != 200:
             return None
         data = response.json()
@@ -782,7 +944,7 @@ def _fetch_nfl_standings(api_base_url):
     if _should_skip_live_api_fetch('NFL', 'today'):
         return {}
     try:
-        response = requests.get(f'{api_base_url}/api/v1/standings/nfl', timeout=10)
+        response = SESSION.get(f'{api_base_url}/api/v1/standings/nfl', timeout=10)
         if response.status_code != 200:
             return None
         data = response.json()
@@ -807,7 +969,7 @@ def _fetch_nfl_standings(api_base_url):
 def _fetch_wnba_standings(api_base_url):
     """Fetch WNBA standings from sportspuff-api keyed by team name."""
     try:
-        response = requests.get(f'{api_base_url}/api/v1/standings/wnba', timeout=10)
+        response = SESSION.get(f'{api_base_url}/api/v1/standings/wnba', timeout=10)
         if response.status_code != 200:
             return None
         data = response.json()
@@ -829,7 +991,7 @@ def _fetch_wnba_standings(api_base_url):
 def _fetch_league_standings(api_base_url, league):
     """Fetch standings keyed by team name and abbreviation for record-based league pages."""
     try:
-        response = requests.get(f'{api_base_url}/api/v1/standings/{league.lower()}', timeout=10)
+        response = SESSION.get(f'{api_base_url}/api/v1/standings/{league.lower()}', timeout=10)
         if response.status_code != 200:
             return None
         data = response.json()
@@ -1036,8 +1198,16 @@ SEASON_DATES = {
 }
 
 
+_iso_today_cache = {'value': None, 'expires_at': 0.0}
+
+
 def _iso_today():
-    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    """Return today's UTC date string, recomputed at most once a minute."""
+    now = time.monotonic()
+    if now >= _iso_today_cache['expires_at']:
+        _iso_today_cache['value'] = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        _iso_today_cache['expires_at'] = now + 60
+    return _iso_today_cache['value']
 
 
 def _league_is_in_active_window(league, date_value=None):
@@ -1062,7 +1232,7 @@ def season_info(league):
             cached = get_cached_response(cache_key, 'schedule')
             if cached:
                 return jsonify(cached)
-            response = requests.get(f'{API_BASE_URL}/api/v1/season-info/{league.lower()}', timeout=10)
+            response = SESSION.get(f'{API_BASE_URL}/api/v1/season-info/{league.lower()}', timeout=10)
             response.raise_for_status()
             data = response.json()
             if (
@@ -1097,7 +1267,7 @@ def season_info(league):
     data = SEASON_DATES.get(league_upper)
     if not data:
         return jsonify({'year': datetime.now().year, 'season_types': []}), 200
-    now = datetime.now().strftime('%Y-%m-%d')
+    now = _iso_today()
     current_phase = 'Off Season'
     season_types = []
     for t in data['types']:
@@ -1120,10 +1290,13 @@ def season_info(league):
 # Load logo mapping
 LOGO_MAPPING = {}
 try:
-    with open('logo_mapping.json', 'r') as f:
-        LOGO_MAPPING = json.load(f)
+    # Resolve next to app.py so gunicorn's working directory doesn't matter
+    with open(os.path.join(os.path.dirname(__file__), 'logo_mapping.json'), 'rb') as f:
+        LOGO_MAPPING = json.loads(f.read())
 except FileNotFoundError:
     print("Logo mapping not found. Run create_logo_mapping.py to generate it.")
+except ValueError as e:
+    logger.warning(f"Ignoring unreadable logo_mapping.json: {e}")
 
 # Database configuration
 DB_CONFIG = {
@@ -1133,12 +1306,35 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', 'password')
 }
 
+# Process-wide connection pool, created on first use so each gunicorn worker
+# opens its own sockets after fork.
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
+def _get_db_pool():
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                minconn = int(os.getenv('DB_POOL_MINCONN', '1'))
+                maxconn = int(os.getenv('DB_POOL_MAXCONN', '20'))
+                logger.info(f"Creating database pool ({minconn}-{maxconn}) with config: host={DB_CONFIG['host']}, database={DB_CONFIG['database']}, user={DB_CONFIG['user']}")
+                _db_pool = ThreadedConnectionPool(minconn, maxconn, **DB_CONFIG)
+    return _db_pool
+
+
 def get_db_connection():
-    """Get database connection"""
+    """Get a pooled database connection; release it with put_db_connection()"""
     try:
-        logger.info(f"Attempting database connection with config: host={DB_CONFIG['host']}, database={DB_CONFIG['database']}, user={DB_CONFIG['user']}")
-        conn = psycopg2.connect(**DB_CONFIG)
-        logger.info("Database connection successful")
+        conn = _get_db_pool().getconn()
+        if not conn.autocommit:
+            # The web app only reads; autocommit skips the implicit BEGIN round
+            # trip and keeps idle pooled connections out of open transactions.
+            conn.set_session(readonly=True, autocommit=True)
+        if has_app_context():
+            # Returned by teardown if a handler bails out before releasing it
+            g.setdefault('_db_connections', []).append(conn)
         return conn
     except psycopg2.Error as e:
         # Log the error
@@ -1151,6 +1347,28 @@ def get_db_connection():
             print(f'Database connection error: {e}')
         return None
 
+
+def put_db_connection(conn):
+    """Return a connection from get_db_connection() to the pool"""
+    if has_app_context():
+        held = g.get('_db_connections', [])
+        if conn in held:
+            held.remove(conn)
+    if _db_pool is None:
+        conn.close()
+        return
+    try:
+        _db_pool.putconn(conn)
+    except PoolError:
+        # Not a pooled connection
+        conn.close()
+
+
+@app.teardown_appcontext
+def _release_db_connections(exc):
+    for conn in list(g.get('_db_connections', [])):
+        put_db_connection(conn)
+
 @app.route('/')
 def index():
     """Home page with overview statistics"""
@@ -1220,7 +1438,7 @@ def index():
         nba_team_colors = team_colors.get('NBA', {})
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         return render_template('index.html', 
                              team_count=team_count,
@@ -1239,7 +1457,7 @@ def index():
         flash(f'Error loading dashboard: {e}', 'error')
         if conn:
             try:
-                conn.close()
+                put_db_connection(conn)
             except:
                 pass
         fallback = _fallback_catalog()
@@ -1283,7 +1501,7 @@ def admin_panel():
         linked_count = cursor.fetchone()['linked_count']
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         return render_template('admin.html', 
                              team_count=team_count,
@@ -1422,6 +1640,14 @@ def _render_regular_league_page(league_name, teams):
         league_info=None,
     )
 
+# League-level rows stored as teams in the catalog; never list them as teams
+PLACEHOLDER_TEAMS = (
+    'Major League Baseball', 'National Football League', 'National Basketball Association',
+    'National Hockey League', 'Major League Soccer', "Women's National Basketball League",
+    'India Premier League', 'Major League Cricket',
+)
+
+
 @app.route('/league/<league_name>')
 def league_page(league_name):
     """League page showing teams or event/tour schedules."""
@@ -1489,18 +1715,14 @@ def league_page(league_name):
             LEFT JOIN conferences c ON t.conference_id = c.conference_id
             LEFT JOIN divisions d ON t.division_id = d.division_id
             WHERE l.league_name_proper = %s
-            AND t.real_team_name NOT IN (
-                'Major League Baseball', 'National Football League', 'National Basketball Association',
-                'National Hockey League', 'Major League Soccer', 'Women''s National Basketball League',
-                'India Premier League', 'Major League Cricket'
-            )
+            AND t.real_team_name <> ALL(%s::text[])
             ORDER BY COALESCE(c.conference_name, 'No Conference'), COALESCE(d.division_name, 'No Division'), t.real_team_name
         """
-        cursor.execute(teams_query, [league_name])
+        cursor.execute(teams_query, [league_name, list(PLACEHOLDER_TEAMS)])
         teams = cursor.fetchall()
 
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
 
         return _render_regular_league_page(league_upper, teams)
     
@@ -1882,6 +2104,46 @@ def world_cup_team_detail(team_code):
         logger.error(f"Error loading World Cup team {team_code}: {e}", exc_info=True)
         return render_template('error.html', message=str(e))
 
+def _leagues_list(cursor):
+    """Return league names for the /teams dropdown, cached for the 'catalog' TTL."""
+    cache_key = 'catalog:leagues'
+    cached = get_cached_response(cache_key, 'catalog')
+    if cached is not None:
+        return cached
+    cursor.execute("SELECT league_name_proper FROM leagues ORDER BY league_name_proper")
+    leagues = [row['league_name_proper'] for row in cursor.fetchall()]
+    set_cached_response(cache_key, leagues)
+    return leagues
+
+
+def _divisions_for(cursor, league):
+    """Return division names and team counts for a league, cached for the 'catalog' TTL."""
+    cache_key = f'catalog:divisions:{league}'
+    cached = get_cached_response(cache_key, 'catalog')
+    if cached is not None:
+        return cached
+    cursor.execute("""
+        SELECT d.division_name as division, COUNT(t.team_id) as team_count
+        FROM divisions d
+        JOIN leagues l ON d.league_id = l.league_id
+        LEFT JOIN teams t ON d.division_id = t.division_id
+        WHERE l.league_name_proper = %s
+        GROUP BY d.division_id, d.division_name
+        ORDER BY d.division_name
+    """, [league])
+    divisions = [dict(row) for row in cursor.fetchall()]
+    set_cached_response(cache_key, divisions)
+    return divisions
+
+
+def _pop_window_total(rows):
+    """Strip the COUNT(*) OVER() total_count column from rows and return it (0 when empty)."""
+    total = rows[0]['total_count'] if rows else 0
+    for row in rows:
+        row.pop('total_count', None)
+    return total
+
+
 @app.route('/teams')
 def teams():
     """List all teams with pagination"""
@@ -1890,6 +2152,9 @@ def teams():
     league_filter = request.args.get('league', '')
     search = request.args.get('search', '')
     linked_filter = request.args.get('linked', '').lower()
+    # Keyset cursor from the previous page's last row (set by the Next link)
+    after_name = request.args.get('after_name')
+    after_id = request.args.get('after_id', type=int)
 
     conn = get_db_connection()
     if not conn:
@@ -1949,57 +2214,53 @@ def teams():
 
         where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
         
-        # Get total count
-        count_query = f"""
-            SELECT COUNT(*) as count 
-            FROM teams t 
-            LEFT JOIN stadiums s ON t.stadium_id = s.stadium_id
-            LEFT JOIN leagues l ON t.league_id = l.league_id
-            {where_clause}
-        """
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()['count']
-        
-        # Get teams with pagination
+        # Get one page of teams plus the filtered total in a single pass.
+        # With a keyset cursor the page seeks past the previous page's last row
+        # instead of scanning and discarding OFFSET rows.
         offset = (page - 1) * per_page
+        keyset = after_name is not None and after_id is not None
+        page_conditions = list(where_conditions)
+        page_params = list(params)
+        if keyset:
+            page_conditions.append("(t.real_team_name, t.team_id) > (%s, %s)")
+            page_params.extend([after_name, after_id])
+        page_where = "WHERE " + " AND ".join(page_conditions) if page_conditions else ""
         teams_query = f"""
             SELECT t.*, s.full_stadium_name, s.city_name as stadium_city, s.state_name as stadium_state,
-                   l.league_name_proper as league
+                   l.league_name_proper as league, COUNT(*) OVER() AS total_count
             FROM teams t 
             LEFT JOIN stadiums s ON t.stadium_id = s.stadium_id
             LEFT JOIN leagues l ON t.league_id = l.league_id
-            {where_clause}
-            ORDER BY t.real_team_name
+            {page_where}
+            ORDER BY t.real_team_name, t.team_id
             LIMIT %s OFFSET %s
         """
-        cursor.execute(teams_query, params + [per_page, offset])
+        cursor.execute(teams_query, page_params + [per_page, 0 if keyset else offset])
         teams = cursor.fetchall()
+        total_count = _pop_window_total(teams)
+        if teams and keyset:
+            # The window only counts rows after the cursor
+            total_count += offset
+        if not teams and offset:
+            # Paged past the end: the window count is empty, so count directly
+            cursor.execute(f"""
+                SELECT COUNT(*) as count 
+                FROM teams t 
+                LEFT JOIN leagues l ON t.league_id = l.league_id
+                {where_clause}
+            """, params)
+            total_count = cursor.fetchone()['count']
         
         # Add abbreviations to each team
         for team in teams:
             team['abbreviation'] = get_team_abbreviation(team['real_team_name'], team.get('league', ''))
         
-        # Get divisions for the selected league
-        divisions = []
-        if league_filter:
-            divisions_query = """
-                SELECT d.division_name as division, COUNT(t.team_id) as team_count
-                FROM divisions d
-                JOIN leagues l ON d.league_id = l.league_id
-                LEFT JOIN teams t ON d.division_id = t.division_id
-                WHERE l.league_name_proper = %s
-                GROUP BY d.division_id, d.division_name
-                ORDER BY d.division_name
-            """
-            cursor.execute(divisions_query, [league_filter])
-            divisions = cursor.fetchall()
-        
-        # Get leagues for filter dropdown
-        cursor.execute("SELECT league_name_proper FROM leagues ORDER BY league_name_proper")
-        leagues = [row['league_name_proper'] for row in cursor.fetchall()]
+        # Get divisions for the selected league and leagues for the filter dropdown
+        divisions = _divisions_for(cursor, league_filter) if league_filter else []
+        leagues = _leagues_list(cursor)
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         # Calculate pagination
         total_pages = (total_count + per_page - 1) // per_page
@@ -2025,6 +2286,9 @@ def stadiums():
     page = request.args.get('page', 1, type=int)
     per_page = 20
     search = request.args.get('search', '')
+    # Keyset cursor from the previous page's last row (set by the Next link)
+    after_name = request.args.get('after_name')
+    after_id = request.args.get('after_id', type=int)
     
     conn = get_db_connection()
     if not conn:
@@ -2056,31 +2320,41 @@ def stadiums():
         params = []
         
         if search:
-            where_clause = "WHERE (full_stadium_name ILIKE %s OR city_name ILIKE %s)"
+            where_clause = "WHERE (s.full_stadium_name ILIKE %s OR s.city_name ILIKE %s)"
             params.extend([f'%{search}%', f'%{search}%'])
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) as count FROM stadiums {where_clause}"
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()['count']
-        
-        # Get stadiums with pagination
+        # Get one page of stadiums plus the filtered total in a single pass,
+        # seeking past the previous page's last row when a keyset cursor is given
         offset = (page - 1) * per_page
+        keyset = after_name is not None and after_id is not None
+        page_where = where_clause
+        page_params = list(params)
+        if keyset:
+            seek = "(s.full_stadium_name, s.stadium_id) > (%s, %s)"
+            page_where = f"{where_clause} AND {seek}" if where_clause else f"WHERE {seek}"
+            page_params.extend([after_name, after_id])
         stadiums_query = f"""
-            SELECT s.*, COUNT(t.team_id) as team_count
+            SELECT s.*, COUNT(t.team_id) as team_count, COUNT(*) OVER() AS total_count
             FROM stadiums s
             LEFT JOIN teams t ON s.stadium_id = t.stadium_id
-            {where_clause}
+            {page_where}
             GROUP BY s.stadium_id
-            ORDER BY s.full_stadium_name
+            ORDER BY s.full_stadium_name, s.stadium_id
             LIMIT %s OFFSET %s
         """
         # Note: s.image field contains stadium image path if available (may be relative path like 'stadiums/league/stadium_name_img.png')
-        cursor.execute(stadiums_query, params + [per_page, offset])
+        cursor.execute(stadiums_query, page_params + [per_page, 0 if keyset else offset])
         stadiums = cursor.fetchall()
+        total_count = _pop_window_total(stadiums)
+        if stadiums and keyset:
+            # The window only counts rows after the cursor
+            total_count += offset
+        if not stadiums and offset:
+            cursor.execute(f"SELECT COUNT(*) as count FROM stadiums s {where_clause}", params)
+            total_count = cursor.fetchone()['count']
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         # Calculate pagination
         total_pages = (total_count + per_page - 1) // per_page
@@ -2126,9 +2400,9 @@ def team_detail_by_name(league_name, team_name):
             LEFT JOIN leagues l ON t.league_id = l.league_id
             LEFT JOIN conferences conf ON t.conference_id = conf.conference_id
             LEFT JOIN divisions div ON t.division_id = div.division_id
-            WHERE LOWER(l.league_name_proper) = LOWER(%s)
-            AND LOWER(REPLACE(t.real_team_name, ' ', '_')) = LOWER(%s)
-        """, (league_name, team_name))
+            WHERE LOWER(l.league_name_proper) = %s
+            AND LOWER(REPLACE(t.real_team_name, ' ', '_')) = %s
+        """, (league_name.lower(), team_name.lower()))
 
         team = cursor.fetchone()
 
@@ -2137,7 +2411,7 @@ def team_detail_by_name(league_name, team_name):
             return redirect(url_for('teams'))
 
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
 
         return render_template('team_detail_horizontal.html', team=team)
 
@@ -2185,7 +2459,7 @@ def team_detail(team_id):
             return redirect(url_for('teams'))
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         return render_template('team_detail_horizontal.html', team=team)
     
@@ -2235,7 +2509,7 @@ def stadium_detail(stadium_id):
         teams = cursor.fetchall()
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
         return render_template('stadium_detail_horizontal.html', stadium=stadium, teams=teams)
     
@@ -2265,9 +2539,9 @@ def api_teams():
         teams = cursor.fetchall()
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
-        return jsonify([dict(team) for team in teams])
+        return _cacheable_json([dict(team) for team in teams], 3600)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2293,9 +2567,9 @@ def api_stadiums():
         stadiums = cursor.fetchall()
 
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
 
-        return jsonify([dict(stadium) for stadium in stadiums])
+        return _cacheable_json([dict(stadium) for stadium in stadiums], 3600)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -2337,8 +2611,8 @@ def api_v1_teams():
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         wheres, params = [], []
         if league:
-            wheres.append("LOWER(l.league_name_proper) = LOWER(%s)")
-            params.append(league)
+            wheres.append("LOWER(l.league_name_proper) = %s")
+            params.append(league.lower())
         if linked == 'true':
             wheres.append("t.stadium_id IS NOT NULL")
         elif linked == 'false':
@@ -2373,7 +2647,7 @@ def api_v1_teams():
         rows = [dict(r) for r in cursor.fetchall()]
 
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         return jsonify({
             'count': len(rows),
             'total': total,
@@ -2445,7 +2719,7 @@ def api_v1_stadiums():
         rows = [dict(r) for r in cursor.fetchall()]
 
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         return jsonify({
             'count': len(rows),
             'total': total,
@@ -2490,8 +2764,8 @@ def curl_v1_teams():
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         wheres, params = [], []
         if league:
-            wheres.append("LOWER(l.league_name_proper) = LOWER(%s)")
-            params.append(league)
+            wheres.append("LOWER(l.league_name_proper) = %s")
+            params.append(league.lower())
         if linked == 'true':
             wheres.append("t.stadium_id IS NOT NULL")
         elif linked == 'false':
@@ -2516,7 +2790,7 @@ def curl_v1_teams():
         """, params + [limit, offset])
         rows = cursor.fetchall()
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
 
         out = ['{:<6} {:<6} {:<32} {:<22} {}'.format('LEAGUE', 'ABBR', 'TEAM', 'CITY', 'STADIUM')]
         out.append('-' * 100)
@@ -2579,7 +2853,7 @@ def curl_v1_stadiums():
         """, params + [limit, offset])
         rows = cursor.fetchall()
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
 
         out = ['{:<5} {:<40} {:<22} {:<6} {}'.format('ID', 'STADIUM', 'CITY', 'STATE', 'TEAMS')]
         out.append('-' * 88)
@@ -2617,14 +2891,6 @@ def serve_stadium_image(filename):
         from flask import abort
         abort(404)
 
-@app.route('/static/logos/<path:filename>')
-def serve_logo(filename):
-    """Serve logo files from splitsp.lat"""
-    # Redirect to splitsp.lat for logos
-    from flask import redirect
-    return redirect(f'https://www.splitsp.lat/logos/{filename}', code=302)
-
-
 @app.template_filter('get_logo')
 def get_logo(team_id):
     """Template filter to get team logo from splitsp.lat using logo_filename column"""
@@ -2640,7 +2906,7 @@ def get_logo(team_id):
             """, [team_id])
             team = cursor.fetchone()
             cursor.close()
-            conn.close()
+            put_db_connection(conn)
             
             if team and team['logo_filename']:
                 league = team['league_name_proper'].lower()
@@ -2655,12 +2921,16 @@ def get_logo(team_id):
 
     return '/static/images/no-logo.png'
 
+@lru_cache(maxsize=64)
+def _league_logo_url(league_lower):
+    return f'https://www.splitsp.lat/logos/{league_lower}/{league_lower}_logo.png'
+
+
 @app.template_filter('get_league_logo')
 def get_league_logo(league):
     """Template filter to get league logo from splitsp.lat"""
     if league:
-        league_lower = league.lower()
-        return f'https://www.splitsp.lat/logos/{league_lower}/{league_lower}_logo.png'
+        return _league_logo_url(league.lower())
     return 'https://www.splitsp.lat/logos/sportspuff/sportspuff-logo.png'
 
 @app.route('/api/proxy/all-scores/<date>')
@@ -2672,7 +2942,7 @@ def proxy_all_scores(date):
     cache_key = f'all_scores:{api_date}:{tz}'
     cached = get_cached_response(cache_key, 'scores')
     if cached:
-        return jsonify(cached)
+        return _cached_json_response(cache_key, cached, 5)
 
     expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
     if expired_cache:
@@ -2680,7 +2950,7 @@ def proxy_all_scores(date):
             cache_key,
             lambda: _refresh_all_scores_cache(API_BASE_URL, api_date, tz)
         )
-        return jsonify(expired_cache)
+        return _cached_json_response(cache_key, expired_cache, 0)
 
     if api_date == 'today':
         _refresh_cache_async(
@@ -2715,7 +2985,7 @@ def proxy_all_scores(date):
                 pass
 
     set_cached_response(cache_key, result)
-    return jsonify(result)
+    return _cached_json_response(cache_key, result, 5)
 
 @app.route('/api/proxy/schedule/<league>/<date>')
 def proxy_schedule(league, date):
@@ -2724,6 +2994,8 @@ def proxy_schedule(league, date):
         # Get timezone from query parameter, default to 'pt'
         tz = _normalize_timezone(request.args.get('tz', 'pt'))
         force_fresh = request.args.get('fresh') == '1'
+        # fresh=1 polls must revalidate every time; the ETag still turns repeats into 304s
+        max_age = 0 if force_fresh else 300
 
         if date.lower() == 'today':
             cache_key = f'schedule:{league}:today:{tz}'
@@ -2735,12 +3007,17 @@ def proxy_schedule(league, date):
         if _should_skip_live_api_fetch(league, api_date):
             return jsonify({'date': _iso_today(), 'games': []}), 200
 
+        path = f'/api/v1/schedule/{league}/{api_date}?tz={tz}'
         cached_response = None if force_fresh else get_cached_response(cache_key, 'schedule')
         if cached_response:
-            return jsonify(cached_response)
-        
+            return _cached_json_response(cache_key, cached_response, max_age)
+
+        stale_response = None if force_fresh else _serve_stale_while_refreshing(cache_key, 'schedule', path)
+        if stale_response:
+            return _cached_json_response(cache_key, stale_response, 0)
+
         try:
-            data = _fetch_api_json(f'/api/v1/schedule/{league}/{api_date}?tz={tz}', timeout=20)
+            data = _fetch_proxy_payload(cache_key, 'schedule', path, timeout=20)
         except requests.exceptions.Timeout:
             logger.error(f"Timeout fetching schedule for {league}/{api_date} after 20s")
             # Return cached response if available, even if expired
@@ -2750,7 +3027,7 @@ def proxy_schedule(league, date):
                 return jsonify(expired_cache)
             # Return empty structure instead of error - frontend can handle this
             logger.warning("No cache available, returning empty schedule")
-            return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'games': []}), 200
+            return jsonify({'date': _iso_today(), 'games': []}), 200
         except requests.exceptions.RequestException as e:
             logger.error(f"Request exception fetching schedule: {e}", exc_info=True)
             # Return cached response if available, even if expired
@@ -2760,17 +3037,14 @@ def proxy_schedule(league, date):
                 return jsonify(expired_cache)
             # Return empty structure instead of error
             logger.warning("No cache available, returning empty schedule")
-            return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'games': []}), 200
+            return jsonify({'date': _iso_today(), 'games': []}), 200
 
         # Check for API errors in response
         if isinstance(data, dict) and 'error' in data:
             logger.error(f"API returned error: {data['error']}")
             return jsonify(data), 500
         
-        # Cache the response
-        set_cached_response(cache_key, data)
-        
-        return jsonify(data)
+        return _cached_json_response(cache_key, data, max_age)
     except requests.exceptions.Timeout:
         logger.error(f"Timeout proxying schedule request")
         # Try to return expired cached response if available
@@ -2783,7 +3057,7 @@ def proxy_schedule(league, date):
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty schedule")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'games': []}), 200
+        return jsonify({'date': _iso_today(), 'games': []}), 200
     except requests.exceptions.RequestException as e:
         logger.error(f"Error proxying schedule request: {e}")
         # Try to return expired cached response if available
@@ -2796,7 +3070,7 @@ def proxy_schedule(league, date):
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty schedule")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'games': []}), 200
+        return jsonify({'date': _iso_today(), 'games': []}), 200
     except Exception as e:
         logger.error(f"Unexpected error in proxy_schedule: {e}", exc_info=True)
         # Try to return expired cached response if available
@@ -2809,7 +3083,7 @@ def proxy_schedule(league, date):
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty schedule")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'games': []}), 200
+        return jsonify({'date': _iso_today(), 'games': []}), 200
 
 @app.route('/api/proxy/standings/<league>')
 def proxy_standings(league):
@@ -3182,7 +3456,7 @@ def wnba_season_info():
         if cached:
             return jsonify(cached)
 
-        response = requests.get(f'{API_BASE_URL}/api/v1/season-info/wnba', timeout=10)
+        response = SESSION.get(f'{API_BASE_URL}/api/v1/season-info/wnba', timeout=10)
         response.raise_for_status()
         data = response.json()
         set_cached_response(cache_key, data)
@@ -3204,7 +3478,7 @@ def cricket_standings(league):
         if cached:
             return jsonify(cached)
 
-        response = requests.get(f'{API_BASE_URL}/api/v1/standings/{league_lower}', timeout=10)
+        response = SESSION.get(f'{API_BASE_URL}/api/v1/standings/{league_lower}', timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -3252,7 +3526,7 @@ def mls_team_records():
         if cached:
             return jsonify(cached)
 
-        response = requests.get(f'{API_BASE_URL}/api/v1/standings/mls', timeout=10)
+        response = SESSION.get(f'{API_BASE_URL}/api/v1/standings/mls', timeout=10)
         if response.status_code != 200:
             return jsonify({'teams': {}}), 200
 
@@ -3282,7 +3556,7 @@ def mls_team_records():
 def api_status_check():
     """Proxy the sportspuff-api status payload (see /api/v1/status contract)."""
     try:
-        resp = requests.get(f'{API_BASE_URL}/api/v1/status', timeout=10)
+        resp = SESSION.get(f'{API_BASE_URL}/api/v1/status', timeout=10)
         resp.raise_for_status()
         return jsonify(resp.json())
     except requests.exceptions.RequestException as e:
@@ -3328,7 +3602,7 @@ def mlb_team_records():
         """)
         rows = cursor.fetchall()
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         team_records = {}
         for row in rows:
             team_records[row['real_team_name']] = {
@@ -3349,7 +3623,7 @@ def nhl_playoff_series():
         if cached:
             return jsonify(cached)
 
-        response = requests.get('https://api-web.nhle.com/v1/schedule/now', timeout=10)
+        response = SESSION.get('https://api-web.nhle.com/v1/schedule/now', timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -3389,6 +3663,8 @@ def proxy_scores(league, date):
         # Get timezone from query parameter, default to 'pt'
         tz = _normalize_timezone(request.args.get('tz', 'pt'))
         force_fresh = request.args.get('fresh') == '1'
+        # fresh=1 polls must revalidate every time; the ETag still turns repeats into 304s
+        max_age = 0 if force_fresh else 5
 
         if date.lower() == 'today':
             cache_key = f'scores:{league}:today:{tz}'
@@ -3398,44 +3674,46 @@ def proxy_scores(league, date):
             api_date = date
 
         if _should_skip_live_api_fetch(league, api_date):
-            return jsonify({'date': _iso_today(), 'scores': []}), 200
+            return _json_response({'date': _iso_today(), 'scores': []})
 
+        path = f'/api/v1/scores/{league}/{api_date}?tz={tz}'
         cached_response = None if force_fresh else get_cached_response(cache_key, 'scores')
         if cached_response:
-            return jsonify(cached_response)
+            return _cached_json_response(cache_key, cached_response, max_age)
+
+        stale_response = None if force_fresh else _serve_stale_while_refreshing(cache_key, 'scores', path)
+        if stale_response:
+            return _cached_json_response(cache_key, stale_response, 0)
 
         try:
-            data = _fetch_api_json(f'/api/v1/scores/{league}/{api_date}?tz={tz}', timeout=20)
+            data = _fetch_proxy_payload(cache_key, 'scores', path, timeout=20)
         except requests.exceptions.Timeout:
             logger.error(f"Timeout fetching scores for {league}/{api_date} after 20s")
             # Return cached response if available, even if expired
             expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
             if expired_cache:
                 logger.warning("Returning expired cached scores due to timeout")
-                return jsonify(expired_cache)
+                return _cached_json_response(cache_key, expired_cache, 0)
             # Return empty structure instead of error - frontend can handle this
             logger.warning("No cache available, returning empty scores")
-            return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'scores': []}), 200
+            return _json_response({'date': _iso_today(), 'scores': []})
         except requests.exceptions.RequestException as e:
             logger.error(f"Request exception fetching scores: {e}", exc_info=True)
             # Return cached response if available, even if expired
             expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
             if expired_cache:
                 logger.warning("Returning expired cached scores due to request exception")
-                return jsonify(expired_cache)
+                return _cached_json_response(cache_key, expired_cache, 0)
             # Return empty structure instead of error
             logger.warning("No cache available, returning empty scores")
-            return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'scores': []}), 200
+            return _json_response({'date': _iso_today(), 'scores': []})
 
         # Check for API errors in response
         if isinstance(data, dict) and 'error' in data:
             logger.error(f"API returned error: {data['error']}")
-            return jsonify(data), 500
-        
-        # Cache the response (very short TTL - 5 seconds)
-        set_cached_response(cache_key, data)
+            return _json_response(data, 500)
         
-        return jsonify(data)
+        return _cached_json_response(cache_key, data, max_age)
     except requests.exceptions.Timeout:
         logger.error(f"Timeout proxying scores request")
         # Try to return expired cached response if available
@@ -3443,12 +3721,12 @@ def proxy_scores(league, date):
             expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
             if expired_cache:
                 logger.warning("Returning expired cached scores after outer timeout")
-                return jsonify(expired_cache)
+                return _cached_json_response(cache_key, expired_cache, 0)
         except:
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty scores")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'scores': []}), 200
+        return _json_response({'date': _iso_today(), 'scores': []})
     except requests.exceptions.RequestException as e:
         logger.error(f"Error proxying scores request: {e}")
         # Try to return expired cached response if available
@@ -3456,12 +3734,12 @@ def proxy_scores(league, date):
             expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
             if expired_cache:
                 logger.warning("Returning expired cached scores after outer request exception")
-                return jsonify(expired_cache)
+                return _cached_json_response(cache_key, expired_cache, 0)
         except:
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty scores")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'scores': []}), 200
+        return _json_response({'date': _iso_today(), 'scores': []})
     except Exception as e:
         logger.error(f"Unexpected error in proxy_scores: {e}", exc_info=True)
         # Try to return expired cached response if available
@@ -3469,60 +3747,75 @@ def proxy_scores(league, date):
             expired_cache = get_cached_response(cache_key, 'scores', allow_expired=True)
             if expired_cache:
                 logger.warning("Returning expired cached scores after unexpected error")
-                return jsonify(expired_cache)
+                return _cached_json_response(cache_key, expired_cache, 0)
         except:
             pass
         # Return empty structure instead of error
         logger.warning("No cache available, returning empty scores")
-        return jsonify({'date': datetime.now(timezone.utc).strftime('%Y-%m-%d'), 'scores': []}), 200
+        return _json_response({'date': _iso_today(), 'scores': []})
 
 @app.route('/api/team-colors/<league>')
 def get_team_colors(league):
     """Get team colors for a league, mapping team names to colors"""
+    cache_key = f'team_colors:{league.lower()}'
+    cached_entry = get_cached_response(cache_key, 'team_colors')
+    if cached_entry is not None:
+        # Cached pre-encoded with its ETag so hits skip the encoder and the hash
+        body, etag = cached_entry
+        return _json_bytes_response(body, etag, max_age=60)
+
     conn = get_db_connection()
     if not conn:
-        return jsonify({'error': 'Database connection failed'}), 500
+        return _json_response({'error': 'Database connection failed'}, 500)
     
     try:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         
-        # Get teams with colors for the specified league
+        # Build the team name -> colors mapping in Postgres; one row comes back
         cursor.execute("""
-            SELECT t.real_team_name, t.team_color_1, t.team_color_2, t.team_color_3
+            SELECT jsonb_object_agg(
+                       t.real_team_name,
+                       jsonb_build_object('color_1', t.team_color_1,
+                                          'color_2', t.team_color_2,
+                                          'color_3', t.team_color_3)
+                   ) AS color_map
             FROM teams t
             JOIN leagues l ON t.league_id = l.league_id
-            WHERE LOWER(l.league_name_proper) = LOWER(%s)
+            WHERE LOWER(l.league_name_proper) = %s
             AND t.team_color_1 IS NOT NULL
-        """, (league,))
-        
-        teams = cursor.fetchall()
+        """, (league.lower(),))
         
-        # Create a mapping of team name to colors
-        color_map = {}
-        for team in teams:
-            color_map[team['real_team_name']] = {
-                'color_1': team['team_color_1'],
-                'color_2': team['team_color_2'],
-                'color_3': team['team_color_3']
-            }
+        color_map = cursor.fetchone()['color_map'] or {}
         
         cursor.close()
-        conn.close()
+        put_db_connection(conn)
         
-        return jsonify(color_map)
+        body = _encode_json(color_map)
+        etag = hashlib.md5(body).hexdigest()
+        # The league comes straight from the URL; caching empty results would
+        # let made-up leagues evict live scores/schedule entries from the
+        # shared cache
+        if color_map:
+            set_cached_response(cache_key, (body, etag))
+        return _json_bytes_response(body, etag, max_age=60)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
 
 if __name__ == '__main__':
+    # Local development only; production runs under gunicorn (see the
+    # systemd unit), e.g. `gunicorn -k gthread -w 2 --threads 8 app:app`.
     import sys
     port = 5000  # Default port
     
     # Check for port argument
-    if len(sys.argv) > 1 and sys.argv[1] == '--port':
+    if '--port' in sys.argv:
         try:
-            port = int(sys.argv[2])
+            port = int(sys.argv[sys.argv.index('--port') + 1])
         except (IndexError, ValueError):
             print("Invalid port argument, using default port 5000")
     
-    app.run(debug=True, host='0.0.0.0', port=port)
+    # The reloader/debugger is opt-in so an accidental `python app.py`
+    # never exposes the interactive debugger.
+    debug = '--dev' in sys.argv or '--debug' in sys.argv
+    app.run(debug=debug, host='0.0.0.0', port=port, threaded=True)
@@ -13,6 +13,24 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+def _dir_entries(directory, listings):
+    """Return the names in directory, reading each directory only once"""
+    if directory not in listings:
+        try:
+            listings[directory] = set(os.listdir(directory or '.'))
+        except OSError:
+            listings[directory] = set()
+    return listings[directory]
+
+
+def _listed(file_path, listings):
+    """Check a path exists using cached directory listings instead of a stat per file"""
+    directory, name = os.path.split(file_path)
+    if directory and not _listed(directory, listings):
+        return False
+    return name in _dir_entries(directory, listings)
+
+
 def run_basic_tests():
     """Run basic tests that don't require database connection"""
     print("🧪 Running Basic Tests...")
@@ -44,9 +62,10 @@ def run_basic_tests():
         'import_data.py'
     ]
     
+    listings = {}
     files_exist = 0
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if _listed(file_path, listings):
             print(f"✅ {file_path} exists")
             files_exist += 1
         else:
@@ -64,10 +83,10 @@ def run_basic_tests():
     ]
     
     templates_exist = 0
-    if os.path.exists(template_dir):
+    if _listed(template_dir, listings):
+        existing_templates = _dir_entries(template_dir, listings)
         for template in required_templates:
-            template_path = os.path.join(template_dir, template)
-            if os.path.exists(template_path):
+            if template in existing_templates:
                 print(f"✅ {template} exists")
                 templates_exist += 1
             else:
@@ -86,7 +105,7 @@ def run_basic_tests():
     
     ansible_files_exist = 0
     for file_path in ansible_files:
-        if os.path.exists(file_path):
+        if _listed(file_path, listings):
             print(f"✅ {file_path} exists")
             ansible_files_exist += 1
         else:
@@ -99,7 +118,7 @@ def run_basic_tests():
     
     workflows_exist = 0
     for file_path in workflow_files:
-        if os.path.exists(file_path):
+        if _listed(file_path, listings):
             print(f"✅ {file_path} exists")
             workflows_exist += 1
         else:
@@ -1,57 +1,63 @@
 #!/usr/bin/env python3
 """Check and fix stadium image_name values"""
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import os
-from dotenv import load_dotenv
-import pandas as pd
-
-load_dotenv()
-
-conn = psycopg2.connect(
-    host=os.getenv('DB_HOST', 'localhost'),
-    database=os.getenv('DB_NAME', 'sportspuff_v6'),
-    user=os.getenv('DB_USER', 'postgres'),
-    password=os.getenv('DB_PASSWORD')
-)
-
-cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-# Check specific stadiums
-cursor.execute("""
-    SELECT stadium_id, full_stadium_name, stadium_name, image_name 
-    FROM stadiums 
-    WHERE stadium_name IN ('dodger_stadium', 'comerica_park')
-    ORDER BY stadium_name
-""")
-results = cursor.fetchall()
-
-print("Current database values:")
-for row in results:
-    print(f"  ID: {row['stadium_id']}, Name: {row['full_stadium_name']}, Image: {row['image_name']}")
-
-# Check how many stadiums have image_name
-cursor.execute("SELECT COUNT(*) as count FROM stadiums WHERE image_name IS NOT NULL AND image_name != ''")
-with_images = cursor.fetchone()['count']
-cursor.execute("SELECT COUNT(*) as count FROM stadiums")
-total = cursor.fetchone()['count']
-
-print(f"\nTotal stadiums: {total}")
-print(f"Stadiums with image_name: {with_images}")
-print(f"Stadiums without image_name: {total - with_images}")
-
-# Read CSV to see what should be there
-print("\nReading CSV...")
-df = pd.read_csv('info-stadiums.csv', encoding='utf-8-sig')
-stadiums_with_images = df[df['image_name'].notna() & (df['image_name'] != '')]
-print(f"CSV has {len(stadiums_with_images)} stadiums with image_name")
-
-# Check a few examples from CSV
-print("\nSample from CSV:")
-for idx, row in stadiums_with_images.head(10).iterrows():
-    print(f"  {row['stadium_name']}: {row['image_name']}")
-
-cursor.close()
-conn.close()
-
+import csv
+
+from db import get_conn
+
+
+def check_database():
+    """Print image_name status for stadiums in the database"""
+    with get_conn() as conn:
+        # Check specific stadiums; a named (server-side) cursor streams rows in
+        # batches so memory stays flat if the filter is widened to every stadium
+        with conn.cursor('stadium_stream') as stream:
+            stream.itersize = 1000
+            stream.execute("""
+                SELECT stadium_id, full_stadium_name, stadium_name, image_name 
+                FROM stadiums 
+                WHERE stadium_name IN ('dodger_stadium', 'comerica_park')
+                ORDER BY stadium_name
+            """)
+            print("Current database values:")
+            for stadium_id, full_stadium_name, stadium_name, image_name in stream:
+                print(f"  ID: {stadium_id}, Name: {full_stadium_name}, Image: {image_name}")
+
+        cursor = conn.cursor()
+
+        # Check how many stadiums have image_name (one scan for both counts)
+        cursor.execute("""
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE image_name IS NOT NULL AND image_name <> '') AS with_images
+            FROM stadiums
+        """)
+        total, with_images = cursor.fetchone()
+
+        print(f"\nTotal stadiums: {total}")
+        print(f"Stadiums with image_name: {with_images}")
+        print(f"Stadiums without image_name: {total - with_images}")
+
+        cursor.close()
+
+
+def check_csv():
+    """Print which stadiums have an image_name in info-stadiums.csv"""
+    # Read CSV to see what should be there
+    print("\nReading CSV...")
+    with open('info-stadiums.csv', newline='', encoding='utf-8-sig') as f:
+        stadiums_with_images = [row for row in csv.DictReader(f) if row.get('image_name')]
+    print(f"CSV has {len(stadiums_with_images)} stadiums with image_name")
+
+    # Check a few examples from CSV
+    print("\nSample from CSV:")
+    for row in stadiums_with_images[:10]:
+        print(f"  {row['stadium_name']}: {row['image_name']}")
+
+
+def main():
+    check_database()
+    check_csv()
+
+
+if __name__ == '__main__':
+    main()
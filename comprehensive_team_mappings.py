@@ -4,6 +4,8 @@ Comprehensive team mapping fix - handles ID mismatches between CSV files
 This script creates proper mappings based on team names and league context
 """
 
+import csv
+import io
 import pandas as pd
 import psycopg2
 from psycopg2.extras import RealDictCursor
@@ -27,227 +29,229 @@ def get_db_connection():
         print(f"Error connecting to database: {e}")
         return None
 
+# Manual mappings based on known team-division relationships, as
+# (team_name, league_id, division_name, conference_name) rows
+_TEAM_MAPPINGS = (
+    # MLB Teams
+    ('Baltimore Orioles', 1, 'East', 'AL'),
+    ('Boston Red Sox', 1, 'East', 'AL'),
+    ('New York Yankees', 1, 'East', 'AL'),
+    ('Tampa Bay Rays', 1, 'East', 'AL'),
+    ('Toronto Blue Jays', 1, 'East', 'AL'),
+
+    ('Chicago White Sox', 1, 'Central', 'AL'),
+    ('Cleveland Guardians', 1, 'Central', 'AL'),
+    ('Detroit Tigers', 1, 'Central', 'AL'),
+    ('Kansas City Royals', 1, 'Central', 'AL'),
+    ('Minnesota Twins', 1, 'Central', 'AL'),
+
+    ('Houston Astros', 1, 'West', 'AL'),
+    ('Los Angeles Angels', 1, 'West', 'AL'),
+    ('Oakland Athletics', 1, 'West', 'AL'),
+    ('Seattle Mariners', 1, 'West', 'AL'),
+    ('Texas Rangers', 1, 'West', 'AL'),
+
+    ('Atlanta Braves', 1, 'East', 'NL'),
+    ('Miami Marlins', 1, 'East', 'NL'),
+    ('New York Mets', 1, 'East', 'NL'),
+    ('Philadelphia Phillies', 1, 'East', 'NL'),
+    ('Washington Nationals', 1, 'East', 'NL'),
+
+    ('Chicago Cubs', 1, 'Central', 'NL'),
+    ('Cincinnati Reds', 1, 'Central', 'NL'),
+    ('Milwaukee Brewers', 1, 'Central', 'NL'),
+    ('Pittsburgh Pirates', 1, 'Central', 'NL'),
+    ('St. Louis Cardinals', 1, 'Central', 'NL'),
+
+    ('Arizona Diamondbacks', 1, 'West', 'NL'),
+    ('Colorado Rockies', 1, 'West', 'NL'),
+    ('Los Angeles Dodgers', 1, 'West', 'NL'),
+    ('San Diego Padres', 1, 'West', 'NL'),
+    ('San Francisco Giants', 1, 'West', 'NL'),
+
+    # NFL Teams - AFC
+    ('Buffalo Bills', 4, 'East', 'AFC'),
+    ('Miami Dolphins', 4, 'East', 'AFC'),
+    ('New England Patriots', 4, 'East', 'AFC'),
+    ('New York Jets', 4, 'East', 'AFC'),
+
+    ('Baltimore Ravens', 4, 'North', 'AFC'),
+    ('Cincinnati Bengals', 4, 'North', 'AFC'),
+    ('Cleveland Browns', 4, 'North', 'AFC'),
+    ('Pittsburgh Steelers', 4, 'North', 'AFC'),
+
+    ('Houston Texans', 4, 'South', 'AFC'),
+    ('Indianapolis Colts', 4, 'South', 'AFC'),
+    ('Jacksonville Jaguars', 4, 'South', 'AFC'),
+    ('Tennessee Titans', 4, 'South', 'AFC'),
+
+    ('Denver Broncos', 4, 'West', 'AFC'),
+    ('Kansas City Chiefs', 4, 'West', 'AFC'),
+    ('Las Vegas Raiders', 4, 'West', 'AFC'),
+    ('Los Angeles Chargers', 4, 'West', 'AFC'),
+
+    # NFL Teams - NFC
+    ('Dallas Cowboys', 4, 'East', 'NFC'),
+    ('New York Giants', 4, 'East', 'NFC'),
+    ('Philadelphia Eagles', 4, 'East', 'NFC'),
+    ('Washington Commanders', 4, 'East', 'NFC'),
+
+    ('Chicago Bears', 4, 'North', 'NFC'),
+    ('Detroit Lions', 4, 'North', 'NFC'),
+    ('Green Bay Packers', 4, 'North', 'NFC'),
+    ('Minnesota Vikings', 4, 'North', 'NFC'),
+
+    ('Atlanta Falcons', 4, 'South', 'NFC'),
+    ('Carolina Panthers', 4, 'South', 'NFC'),
+    ('New Orleans Saints', 4, 'South', 'NFC'),
+    ('Tampa Bay Buccaneers', 4, 'South', 'NFC'),
+
+    ('Arizona Cardinals', 4, 'West', 'NFC'),
+    ('Los Angeles Rams', 4, 'West', 'NFC'),
+    ('San Francisco 49ers', 4, 'West', 'NFC'),
+    ('Seattle Seahawks', 4, 'West', 'NFC'),
+
+    # NBA Teams - Eastern Conference
+    ('Boston Celtics', 3, 'Atlantic', 'Eastern'),
+    ('Brooklyn Nets', 3, 'Atlantic', 'Eastern'),
+    ('New York Knicks', 3, 'Atlantic', 'Eastern'),
+    ('Philadelphia 76ers', 3, 'Atlantic', 'Eastern'),
+    ('Toronto Raptors', 3, 'Atlantic', 'Eastern'),
+
+    ('Chicago Bulls', 3, 'Central', 'Eastern'),
+    ('Cleveland Cavaliers', 3, 'Central', 'Eastern'),
+    ('Detroit Pistons', 3, 'Central', 'Eastern'),
+    ('Indiana Pacers', 3, 'Central', 'Eastern'),
+    ('Milwaukee Bucks', 3, 'Central', 'Eastern'),
+
+    ('Atlanta Hawks', 3, 'Southeast', 'Eastern'),
+    ('Charlotte Hornets', 3, 'Southeast', 'Eastern'),
+    ('Miami Heat', 3, 'Southeast', 'Eastern'),
+    ('Orlando Magic', 3, 'Southeast', 'Eastern'),
+    ('Washington Wizards', 3, 'Southeast', 'Eastern'),
+
+    # NBA Teams - Western Conference
+    ('Denver Nuggets', 3, 'Northwest', 'Western'),
+    ('Minnesota Timberwolves', 3, 'Northwest', 'Western'),
+    ('Oklahoma City Thunder', 3, 'Northwest', 'Western'),
+    ('Portland Trail Blazers', 3, 'Northwest', 'Western'),
+    ('Utah Jazz', 3, 'Northwest', 'Western'),
+
+    ('Dallas Mavericks', 3, 'Southwest', 'Western'),
+    ('Houston Rockets', 3, 'Southwest', 'Western'),
+    ('Memphis Grizzlies', 3, 'Southwest', 'Western'),
+    ('New Orleans Pelicans', 3, 'Southwest', 'Western'),
+    ('San Antonio Spurs', 3, 'Southwest', 'Western'),
+
+    ('Golden State Warriors', 3, 'Pacific', 'Western'),
+    ('Los Angeles Clippers', 3, 'Pacific', 'Western'),
+    ('Los Angeles Lakers', 3, 'Pacific', 'Western'),
+    ('Phoenix Suns', 3, 'Pacific', 'Western'),
+    ('Sacramento Kings', 3, 'Pacific', 'Western'),
+
+    # NHL Teams - Eastern Conference
+    ('Boston Bruins', 5, 'Atlantic', 'Eastern'),
+    ('Buffalo Sabres', 5, 'Atlantic', 'Eastern'),
+    ('Detroit Red Wings', 5, 'Atlantic', 'Eastern'),
+    ('Florida Panthers', 5, 'Atlantic', 'Eastern'),
+    ('Montreal Canadiens', 5, 'Atlantic', 'Eastern'),
+    ('Ottawa Senators', 5, 'Atlantic', 'Eastern'),
+    ('Tampa Bay Lightning', 5, 'Atlantic', 'Eastern'),
+    ('Toronto Maple Leafs', 5, 'Atlantic', 'Eastern'),
+
+    ('Carolina Hurricanes', 5, 'Metropolitan', 'Eastern'),
+    ('Columbus Blue Jackets', 5, 'Metropolitan', 'Eastern'),
+    ('New Jersey Devils', 5, 'Metropolitan', 'Eastern'),
+    ('New York Islanders', 5, 'Metropolitan', 'Eastern'),
+    ('New York Rangers', 5, 'Metropolitan', 'Eastern'),
+    ('Philadelphia Flyers', 5, 'Metropolitan', 'Eastern'),
+    ('Pittsburgh Penguins', 5, 'Metropolitan', 'Eastern'),
+    ('Washington Capitals', 5, 'Metropolitan', 'Eastern'),
+
+    # NHL Teams - Western Conference
+    ('Chicago Blackhawks', 5, 'Central', 'Western'),
+    ('Colorado Avalanche', 5, 'Central', 'Western'),
+    ('Dallas Stars', 5, 'Central', 'Western'),
+    ('Minnesota Wild', 5, 'Central', 'Western'),
+    ('Nashville Predators', 5, 'Central', 'Western'),
+    ('St. Louis Blues', 5, 'Central', 'Western'),
+    ('Winnipeg Jets', 5, 'Central', 'Western'),
+
+    ('Anaheim Ducks', 5, 'Pacific', 'Western'),
+    ('Calgary Flames', 5, 'Pacific', 'Western'),
+    ('Edmonton Oilers', 5, 'Pacific', 'Western'),
+    ('Los Angeles Kings', 5, 'Pacific', 'Western'),
+    ('San Jose Sharks', 5, 'Pacific', 'Western'),
+    ('Seattle Kraken', 5, 'Pacific', 'Western'),
+    ('Vancouver Canucks', 5, 'Pacific', 'Western'),
+    ('Vegas Golden Knights', 5, 'Pacific', 'Western'),
+
+    # MLS Teams
+    ('Atlanta United FC', 2, 'Eastern', 'Eastern'),
+    ('Austin FC', 2, 'Western', 'Western'),
+    ('CF Montréal', 2, 'Eastern', 'Eastern'),
+    ('Charlotte FC', 2, 'Eastern', 'Eastern'),
+    ('Chicago Fire FC', 2, 'Eastern', 'Eastern'),
+    ('Colorado Rapids', 2, 'Western', 'Western'),
+    ('Columbus Crew', 2, 'Eastern', 'Eastern'),
+    ('D.C. United', 2, 'Eastern', 'Eastern'),
+    ('FC Cincinnati', 2, 'Eastern', 'Eastern'),
+    ('FC Dallas', 2, 'Western', 'Western'),
+    ('Houston Dynamo FC', 2, 'Western', 'Western'),
+    ('Inter Miami CF', 2, 'Eastern', 'Eastern'),
+    ('Los Angeles Galaxy', 2, 'Western', 'Western'),
+    ('Los Angeles FC', 2, 'Western', 'Western'),
+    ('Minnesota United FC', 2, 'Western', 'Western'),
+    ('Nashville SC', 2, 'Eastern', 'Eastern'),
+    ('New England Revolution', 2, 'Eastern', 'Eastern'),
+    ('New York City FC', 2, 'Eastern', 'Eastern'),
+    ('New York Red Bulls', 2, 'Eastern', 'Eastern'),
+    ('Orlando City SC', 2, 'Eastern', 'Eastern'),
+    ('Philadelphia Union', 2, 'Eastern', 'Eastern'),
+    ('Portland Timbers', 2, 'Western', 'Western'),
+    ('Real Salt Lake', 2, 'Western', 'Western'),
+    ('San Diego FC', 2, 'Western', 'Western'),
+    ('San Jose Earthquakes', 2, 'Western', 'Western'),
+    ('Seattle Sounders FC', 2, 'Western', 'Western'),
+    ('Sporting Kansas City', 2, 'Western', 'Western'),
+    ('St. Louis City SC', 2, 'Western', 'Western'),
+    ('Toronto FC', 2, 'Eastern', 'Eastern'),
+    ('Vancouver Whitecaps FC', 2, 'Western', 'Western'),
+
+    # WNBA Teams
+    ('Atlanta Dream', 6, 'Eastern', 'Eastern'),
+    ('Chicago Sky', 6, 'Eastern', 'Eastern'),
+    ('Connecticut Sun', 6, 'Eastern', 'Eastern'),
+    ('Indiana Fever', 6, 'Eastern', 'Eastern'),
+    ('New York Liberty', 6, 'Eastern', 'Eastern'),
+    ('Washington Mystics', 6, 'Eastern', 'Eastern'),
+
+    ('Dallas Wings', 6, 'Western', 'Western'),
+    ('Golden State Valkyries', 6, 'Western', 'Western'),
+    ('Las Vegas Aces', 6, 'Western', 'Western'),
+    ('Los Angeles Sparks', 6, 'Western', 'Western'),
+    ('Minnesota Lynx', 6, 'Western', 'Western'),
+    ('Phoenix Mercury', 6, 'Western', 'Western'),
+    ('Seattle Storm', 6, 'Western', 'Western'),
+
+    # IPL Teams
+    ('Chennai Super Kings', 7, 'IPL', 'IPL'),
+    ('Delhi Capitals', 7, 'IPL', 'IPL'),
+    ('Gujarat Titans', 7, 'IPL', 'IPL'),
+    ('Kolkata Knight Riders', 7, 'IPL', 'IPL'),
+    ('Lucknow Super Giants', 7, 'IPL', 'IPL'),
+    ('Mumbai Indians', 7, 'IPL', 'IPL'),
+    ('Punjab Kings', 7, 'IPL', 'IPL'),
+    ('Rajasthan Royals', 7, 'IPL', 'IPL'),
+    ('Royal Challengers Bengaluru', 7, 'IPL', 'IPL'),
+    ('Sunrisers Hyderabad', 7, 'IPL', 'IPL'),
+)
+
+TEAM_MAPPINGS_BY_NAME = {row[0]: row for row in _TEAM_MAPPINGS}
+
 def create_comprehensive_mappings():
-    """Create comprehensive team mappings based on known team-division relationships"""
-    
-    # Manual mappings based on known team-division relationships
-    team_mappings = {
-        # MLB Teams
-        'Baltimore Orioles': {'league_id': 1, 'division_name': 'East', 'conference_name': 'AL'},
-        'Boston Red Sox': {'league_id': 1, 'division_name': 'East', 'conference_name': 'AL'},
-        'New York Yankees': {'league_id': 1, 'division_name': 'East', 'conference_name': 'AL'},
-        'Tampa Bay Rays': {'league_id': 1, 'division_name': 'East', 'conference_name': 'AL'},
-        'Toronto Blue Jays': {'league_id': 1, 'division_name': 'East', 'conference_name': 'AL'},
-        
-        'Chicago White Sox': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'AL'},
-        'Cleveland Guardians': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'AL'},
-        'Detroit Tigers': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'AL'},
-        'Kansas City Royals': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'AL'},
-        'Minnesota Twins': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'AL'},
-        
-        'Houston Astros': {'league_id': 1, 'division_name': 'West', 'conference_name': 'AL'},
-        'Los Angeles Angels': {'league_id': 1, 'division_name': 'West', 'conference_name': 'AL'},
-        'Oakland Athletics': {'league_id': 1, 'division_name': 'West', 'conference_name': 'AL'},
-        'Seattle Mariners': {'league_id': 1, 'division_name': 'West', 'conference_name': 'AL'},
-        'Texas Rangers': {'league_id': 1, 'division_name': 'West', 'conference_name': 'AL'},
-        
-        'Atlanta Braves': {'league_id': 1, 'division_name': 'East', 'conference_name': 'NL'},
-        'Miami Marlins': {'league_id': 1, 'division_name': 'East', 'conference_name': 'NL'},
-        'New York Mets': {'league_id': 1, 'division_name': 'East', 'conference_name': 'NL'},
-        'Philadelphia Phillies': {'league_id': 1, 'division_name': 'East', 'conference_name': 'NL'},
-        'Washington Nationals': {'league_id': 1, 'division_name': 'East', 'conference_name': 'NL'},
-        
-        'Chicago Cubs': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'NL'},
-        'Cincinnati Reds': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'NL'},
-        'Milwaukee Brewers': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'NL'},
-        'Pittsburgh Pirates': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'NL'},
-        'St. Louis Cardinals': {'league_id': 1, 'division_name': 'Central', 'conference_name': 'NL'},
-        
-        'Arizona Diamondbacks': {'league_id': 1, 'division_name': 'West', 'conference_name': 'NL'},
-        'Colorado Rockies': {'league_id': 1, 'division_name': 'West', 'conference_name': 'NL'},
-        'Los Angeles Dodgers': {'league_id': 1, 'division_name': 'West', 'conference_name': 'NL'},
-        'San Diego Padres': {'league_id': 1, 'division_name': 'West', 'conference_name': 'NL'},
-        'San Francisco Giants': {'league_id': 1, 'division_name': 'West', 'conference_name': 'NL'},
-        
-        # NFL Teams - AFC
-        'Buffalo Bills': {'league_id': 4, 'division_name': 'East', 'conference_name': 'AFC'},
-        'Miami Dolphins': {'league_id': 4, 'division_name': 'East', 'conference_name': 'AFC'},
-        'New England Patriots': {'league_id': 4, 'division_name': 'East', 'conference_name': 'AFC'},
-        'New York Jets': {'league_id': 4, 'division_name': 'East', 'conference_name': 'AFC'},
-        
-        'Baltimore Ravens': {'league_id': 4, 'division_name': 'North', 'conference_name': 'AFC'},
-        'Cincinnati Bengals': {'league_id': 4, 'division_name': 'North', 'conference_name': 'AFC'},
-        'Cleveland Browns': {'league_id': 4, 'division_name': 'North', 'conference_name': 'AFC'},
-        'Pittsburgh Steelers': {'league_id': 4, 'division_name': 'North', 'conference_name': 'AFC'},
-        
-        'Houston Texans': {'league_id': 4, 'division_name': 'South', 'conference_name': 'AFC'},
-        'Indianapolis Colts': {'league_id': 4, 'division_name': 'South', 'conference_name': 'AFC'},
-        'Jacksonville Jaguars': {'league_id': 4, 'division_name': 'South', 'conference_name': 'AFC'},
-        'Tennessee Titans': {'league_id': 4, 'division_name': 'South', 'conference_name': 'AFC'},
-        
-        'Denver Broncos': {'league_id': 4, 'division_name': 'West', 'conference_name': 'AFC'},
-        'Kansas City Chiefs': {'league_id': 4, 'division_name': 'West', 'conference_name': 'AFC'},
-        'Las Vegas Raiders': {'league_id': 4, 'division_name': 'West', 'conference_name': 'AFC'},
-        'Los Angeles Chargers': {'league_id': 4, 'division_name': 'West', 'conference_name': 'AFC'},
-        
-        # NFL Teams - NFC
-        'Dallas Cowboys': {'league_id': 4, 'division_name': 'East', 'conference_name': 'NFC'},
-        'New York Giants': {'league_id': 4, 'division_name': 'East', 'conference_name': 'NFC'},
-        'Philadelphia Eagles': {'league_id': 4, 'division_name': 'East', 'conference_name': 'NFC'},
-        'Washington Commanders': {'league_id': 4, 'division_name': 'East', 'conference_name': 'NFC'},
-        
-        'Chicago Bears': {'league_id': 4, 'division_name': 'North', 'conference_name': 'NFC'},
-        'Detroit Lions': {'league_id': 4, 'division_name': 'North', 'conference_name': 'NFC'},
-        'Green Bay Packers': {'league_id': 4, 'division_name': 'North', 'conference_name': 'NFC'},
-        'Minnesota Vikings': {'league_id': 4, 'division_name': 'North', 'conference_name': 'NFC'},
-        
-        'Atlanta Falcons': {'league_id': 4, 'division_name': 'South', 'conference_name': 'NFC'},
-        'Carolina Panthers': {'league_id': 4, 'division_name': 'South', 'conference_name': 'NFC'},
-        'New Orleans Saints': {'league_id': 4, 'division_name': 'South', 'conference_name': 'NFC'},
-        'Tampa Bay Buccaneers': {'league_id': 4, 'division_name': 'South', 'conference_name': 'NFC'},
-        
-        'Arizona Cardinals': {'league_id': 4, 'division_name': 'West', 'conference_name': 'NFC'},
-        'Los Angeles Rams': {'league_id': 4, 'division_name': 'West', 'conference_name': 'NFC'},
-        'San Francisco 49ers': {'league_id': 4, 'division_name': 'West', 'conference_name': 'NFC'},
-        'Seattle Seahawks': {'league_id': 4, 'division_name': 'West', 'conference_name': 'NFC'},
-        
-        # NBA Teams - Eastern Conference
-        'Boston Celtics': {'league_id': 3, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Brooklyn Nets': {'league_id': 3, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'New York Knicks': {'league_id': 3, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Philadelphia 76ers': {'league_id': 3, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Toronto Raptors': {'league_id': 3, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        
-        'Chicago Bulls': {'league_id': 3, 'division_name': 'Central', 'conference_name': 'Eastern'},
-        'Cleveland Cavaliers': {'league_id': 3, 'division_name': 'Central', 'conference_name': 'Eastern'},
-        'Detroit Pistons': {'league_id': 3, 'division_name': 'Central', 'conference_name': 'Eastern'},
-        'Indiana Pacers': {'league_id': 3, 'division_name': 'Central', 'conference_name': 'Eastern'},
-        'Milwaukee Bucks': {'league_id': 3, 'division_name': 'Central', 'conference_name': 'Eastern'},
-        
-        'Atlanta Hawks': {'league_id': 3, 'division_name': 'Southeast', 'conference_name': 'Eastern'},
-        'Charlotte Hornets': {'league_id': 3, 'division_name': 'Southeast', 'conference_name': 'Eastern'},
-        'Miami Heat': {'league_id': 3, 'division_name': 'Southeast', 'conference_name': 'Eastern'},
-        'Orlando Magic': {'league_id': 3, 'division_name': 'Southeast', 'conference_name': 'Eastern'},
-        'Washington Wizards': {'league_id': 3, 'division_name': 'Southeast', 'conference_name': 'Eastern'},
-        
-        # NBA Teams - Western Conference
-        'Denver Nuggets': {'league_id': 3, 'division_name': 'Northwest', 'conference_name': 'Western'},
-        'Minnesota Timberwolves': {'league_id': 3, 'division_name': 'Northwest', 'conference_name': 'Western'},
-        'Oklahoma City Thunder': {'league_id': 3, 'division_name': 'Northwest', 'conference_name': 'Western'},
-        'Portland Trail Blazers': {'league_id': 3, 'division_name': 'Northwest', 'conference_name': 'Western'},
-        'Utah Jazz': {'league_id': 3, 'division_name': 'Northwest', 'conference_name': 'Western'},
-        
-        'Dallas Mavericks': {'league_id': 3, 'division_name': 'Southwest', 'conference_name': 'Western'},
-        'Houston Rockets': {'league_id': 3, 'division_name': 'Southwest', 'conference_name': 'Western'},
-        'Memphis Grizzlies': {'league_id': 3, 'division_name': 'Southwest', 'conference_name': 'Western'},
-        'New Orleans Pelicans': {'league_id': 3, 'division_name': 'Southwest', 'conference_name': 'Western'},
-        'San Antonio Spurs': {'league_id': 3, 'division_name': 'Southwest', 'conference_name': 'Western'},
-        
-        'Golden State Warriors': {'league_id': 3, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Los Angeles Clippers': {'league_id': 3, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Los Angeles Lakers': {'league_id': 3, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Phoenix Suns': {'league_id': 3, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Sacramento Kings': {'league_id': 3, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        
-        # NHL Teams - Eastern Conference
-        'Boston Bruins': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Buffalo Sabres': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Detroit Red Wings': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Florida Panthers': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Montreal Canadiens': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Ottawa Senators': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Tampa Bay Lightning': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        'Toronto Maple Leafs': {'league_id': 5, 'division_name': 'Atlantic', 'conference_name': 'Eastern'},
-        
-        'Carolina Hurricanes': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'Columbus Blue Jackets': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'New Jersey Devils': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'New York Islanders': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'New York Rangers': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'Philadelphia Flyers': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'Pittsburgh Penguins': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        'Washington Capitals': {'league_id': 5, 'division_name': 'Metropolitan', 'conference_name': 'Eastern'},
-        
-        # NHL Teams - Western Conference
-        'Chicago Blackhawks': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'Colorado Avalanche': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'Dallas Stars': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'Minnesota Wild': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'Nashville Predators': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'St. Louis Blues': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        'Winnipeg Jets': {'league_id': 5, 'division_name': 'Central', 'conference_name': 'Western'},
-        
-        'Anaheim Ducks': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Calgary Flames': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Edmonton Oilers': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Los Angeles Kings': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'San Jose Sharks': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Seattle Kraken': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Vancouver Canucks': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        'Vegas Golden Knights': {'league_id': 5, 'division_name': 'Pacific', 'conference_name': 'Western'},
-        
-        # MLS Teams
-        'Atlanta United FC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Austin FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'CF Montréal': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Charlotte FC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Chicago Fire FC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Colorado Rapids': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Columbus Crew': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'D.C. United': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'FC Cincinnati': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'FC Dallas': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Houston Dynamo FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Inter Miami CF': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Los Angeles Galaxy': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Los Angeles FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Minnesota United FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Nashville SC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'New England Revolution': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'New York City FC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'New York Red Bulls': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Orlando City SC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Philadelphia Union': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Portland Timbers': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Real Salt Lake': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'San Diego FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'San Jose Earthquakes': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Seattle Sounders FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Sporting Kansas City': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'St. Louis City SC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Toronto FC': {'league_id': 2, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Vancouver Whitecaps FC': {'league_id': 2, 'division_name': 'Western', 'conference_name': 'Western'},
-        
-        # WNBA Teams
-        'Atlanta Dream': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Chicago Sky': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Connecticut Sun': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Indiana Fever': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'New York Liberty': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        'Washington Mystics': {'league_id': 6, 'division_name': 'Eastern', 'conference_name': 'Eastern'},
-        
-        'Dallas Wings': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Golden State Valkyries': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Las Vegas Aces': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Los Angeles Sparks': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Minnesota Lynx': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Phoenix Mercury': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        'Seattle Storm': {'league_id': 6, 'division_name': 'Western', 'conference_name': 'Western'},
-        
-        # IPL Teams
-        'Chennai Super Kings': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Delhi Capitals': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Gujarat Titans': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Kolkata Knight Riders': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Lucknow Super Giants': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Mumbai Indians': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Punjab Kings': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Rajasthan Royals': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Royal Challengers Bengaluru': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-        'Sunrisers Hyderabad': {'league_id': 7, 'division_name': 'IPL', 'conference_name': 'IPL'},
-    }
-    
-    return team_mappings
+    """Return team mappings keyed by team name, built once at import time"""
+    return TEAM_MAPPINGS_BY_NAME
 
 def fix_all_team_mappings():
     """Fix all team division and conference mappings using comprehensive mappings"""
@@ -266,18 +270,33 @@ def fix_all_team_mappings():
     try:
         cursor = conn.cursor()
         
-        # Update teams with correct division and conference names
-        updated_count = 0
-        for team_name, mapping in team_mappings.items():
-            cursor.execute("""
-                UPDATE teams 
-                SET division_name = %s, conference_name = %s
-                WHERE real_team_name = %s AND league_id = %s
-            """, (mapping['division_name'], mapping['conference_name'], team_name, mapping['league_id']))
-            
-            if cursor.rowcount > 0:
-                updated_count += 1
-                print(f"Updated {team_name}: {mapping['division_name']} / {mapping['conference_name']}")
+        # Stream all mappings into a temp table with COPY, then update teams
+        # from it in one set-based statement
+        cursor.execute("""
+            CREATE TEMP TABLE team_patch (
+                real_team_name TEXT,
+                league_id INTEGER,
+                division_name TEXT,
+                conference_name TEXT
+            ) ON COMMIT DROP
+        """)
+        patch_csv = io.StringIO()
+        csv.writer(patch_csv).writerows(team_mappings.values())
+        patch_csv.seek(0)
+        cursor.copy_expert("COPY team_patch FROM STDIN WITH (FORMAT csv)", patch_csv)
+        
+        cursor.execute("""
+            UPDATE teams t
+            SET division_name = p.division_name, conference_name = p.conference_name
+            FROM team_patch p
+            WHERE t.real_team_name = p.real_team_name AND t.league_id = p.league_id
+            RETURNING t.real_team_name, t.division_name, t.conference_name
+        """)
+        updated = cursor.fetchall()
+        
+        updated_count = len(updated)
+        for team_name, division_name, conference_name in updated:
+            print(f"Updated {team_name}: {division_name} / {conference_name}")
         
         conn.commit()
         cursor.close()
@@ -287,13 +306,15 @@ def fix_all_team_mappings():
         # Verify the updates
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         cursor.execute("""
-            SELECT l.league_name_proper, d.division_name, COUNT(t.team_id) as team_count
-            FROM leagues l
-            LEFT JOIN divisions d ON l.league_id = d.league_id
-            LEFT JOIN teams t ON l.league_id = t.league_id AND d.division_name = t.division_name
-            GROUP BY l.league_name_proper, d.division_name
-            HAVING COUNT(t.team_id) > 0
-            ORDER BY l.league_name_proper, d.division_name
+            WITH division_counts AS (
+                SELECT league_id, division_name, COUNT(*) as team_count
+                FROM teams
+                GROUP BY league_id, division_name
+            )
+            SELECT l.league_name_proper, dc.division_name, dc.team_count
+            FROM division_counts dc
+            JOIN leagues l ON l.league_id = dc.league_id
+            ORDER BY l.league_name_proper, dc.division_name
         """)
         
         results = cursor.fetchall()
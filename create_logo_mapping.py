@@ -4,57 +4,192 @@ Logo mapping utility for sportspuff-v6
 Maps team names to their corresponding logo files
 """
 
+import difflib
+import hashlib
 import os
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+
+@lru_cache(maxsize=2048)
 def normalize_team_name(team_name):
     """Normalize team name for logo matching"""
-    # Convert to lowercase and replace spaces/special chars with underscores
-    normalized = team_name.lower()
-    normalized = re.sub(r'[^a-z0-9]', '_', normalized)
-    normalized = re.sub(r'_+', '_', normalized)  # Remove multiple underscores
-    normalized = normalized.strip('_')  # Remove leading/trailing underscores
-    return normalized
-
-def find_logo_file(team_name, league):
-    """Find the logo file for a team"""
-    logos_dir = Path('logos')
-    league_dir = logos_dir / league.lower()
-    
-    if not league_dir.exists():
+    # Lowercase, replace spaces/special chars with single underscores and
+    # trim leading/trailing underscores
+    return _MULTI_UNDERSCORE.sub('_', _NON_ALNUM.sub('_', team_name.lower())).strip('_')
+
+def normalize_team_names(team_names):
+    """Vectorized normalize_team_name over a pandas Series of team names"""
+    return team_names.str.lower().str.replace(r'[^a-z0-9]+', '_', regex=True).str.strip('_')
+
+def _scan_league_dir(league_dir):
+    """List a league's logo files as {filename: path}, or None if it is missing"""
+    try:
+        with os.scandir(league_dir) as entries:
+            return {entry.name: entry.path for entry in entries if entry.name.endswith('.png')}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def index_logo_files(logos_dir='logos'):
+    """Index logo files once as {league: {filename: path}}"""
+    try:
+        with os.scandir(logos_dir) as entries:
+            # DirEntry.is_dir() uses the type cached by scandir, no stat call
+            league_dirs = [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
+        return {}
+    
+    # Listing a directory is I/O-bound and releases the GIL, so scan the
+    # league directories concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(league_dirs) or 1)) as executor:
+        listings = executor.map(_scan_league_dir, [entry.path for entry in league_dirs])
+        return {entry.name: files for entry, files in zip(league_dirs, listings)}
+
+def build_partial_matchers(index):
+    """Precompute per-league lookups for partial logo matching
+
+    Each league gets its lowercased stems joined into one newline-separated
+    string (so "team name within stem" is a single substring search), the
+    start offset of each stem, the paths in file order, and the first file
+    position of every distinct stem (scanned once for "stem within team
+    name").
+    """
+    matchers = {}
+    for league, league_files in index.items():
+        stems = [filename[:-len('.png')].lower() for filename in league_files]
+        starts = []
+        offset = 0
+        for stem in stems:
+            starts.append(offset)
+            offset += len(stem) + 1
+        first_by_stem = {}
+        for position, stem in enumerate(stems):
+            first_by_stem.setdefault(stem, position)
+        matchers[league] = ('\n'.join(stems), starts, list(league_files.values()), first_by_stem)
+    return matchers
+
+def _find_partial_match(normalized_name, matcher):
+    """Return the first logo whose stem contains, or is contained in, the name"""
+    blob, starts, paths, first_by_stem = matcher
+    if not paths:
         return None
     
-    # Try exact match first
-    normalized_name = normalize_team_name(team_name)
-    logo_filename = f"{normalized_name}_logo.png"
-    logo_path = league_dir / logo_filename
+    # Name inside a stem: one search over the joined stems
+    best = len(paths)
+    found_at = blob.find(normalized_name) if normalized_name else -1
+    if found_at != -1:
+        best = bisect_right(starts, found_at) - 1
     
-    if logo_path.exists():
-        return str(logo_path)
+    # Stem inside the name: one pass over the distinct stems; an empty stem
+    # would match every name, so it never counts
+    best = min((position for stem, position in first_by_stem.items()
+                if stem and position < best and stem in normalized_name), default=best)
+    
+    return paths[best] if best < len(paths) else None
+
+def _split_city_nickname(stem):
+    """Split a normalized "city_nickname" stem at its last underscore"""
+    city, _, nickname = stem.rpartition('_')
+    return city, nickname
+
+def _find_fuzzy_match(normalized_name, matcher, cutoff=0.8, margin=0.1):
+    """Return the logo whose nickname is closest to the team's, if unambiguous
+
+    Catches nickname spelling variants that no substring test matches. Only
+    the nickname is scored, and only against logos for the same city, so a
+    shared city prefix ("los_angeles_...") can never carry a rival's logo
+    over the cutoff; the best score must also beat the runner-up by margin.
+    """
+    _, _, paths, first_by_stem = matcher
+    city, nickname = _split_city_nickname(normalized_name)
+    if not nickname:
+        return None
+    scores = {}
+    for stem, position in first_by_stem.items():
+        stem_city, stem_nickname = _split_city_nickname(stem.removesuffix('_logo'))
+        if stem_city != city or not stem_nickname:
+            continue
+        score = difflib.SequenceMatcher(None, nickname, stem_nickname).ratio()
+        scores[position] = max(score, scores.get(position, 0.0))
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    if not ranked or ranked[0][1] < cutoff:
+        return None
+    if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < margin:
+        return None
+    return paths[ranked[0][0]]
+
+def find_logo_match(team_name, league, index=None, matchers=None, normalized_name=None):
+    """Find the logo file for a team; returns (logo_path, is_fuzzy)
+
+    normalized_name may be passed when it was already computed in bulk.
+    Fuzzy matches are flagged so callers can keep them apart for review.
+    """
+    if index is None:
+        return _find_logo_match_standalone(team_name, league.lower())
+    league_files = index.get(league.lower())
     
-    # Try variations
-    variations = [
+    if league_files is None:
+        return None, False
+    
+    # Try exact match first, then variations
+    if normalized_name is None:
+        normalized_name = normalize_team_name(team_name)
+    candidates = (
+        f"{normalized_name}_logo.png",
         f"{normalized_name}.png",
         f"{normalized_name}_logo.svg.png",
         f"{normalized_name}.svg.png"
-    ]
+    )
     
-    for variation in variations:
-        logo_path = league_dir / variation
-        if logo_path.exists():
-            return str(logo_path)
+    for candidate in candidates:
+        logo_path = league_files.get(candidate)
+        if logo_path:
+            return logo_path, False
     
     # Try partial matches
-    for logo_file in league_dir.glob("*.png"):
-        logo_name = logo_file.stem.lower()
-        if normalized_name in logo_name or logo_name in normalized_name:
-            return str(logo_file)
-    
-    return None
+    if matchers is None:
+        matchers = build_partial_matchers({league.lower(): league_files})
+    matcher = matchers[league.lower()]
+    logo_path = _find_partial_match(normalized_name, matcher)
+    if logo_path:
+        return logo_path, False
+    logo_path = _find_fuzzy_match(normalized_name, matcher)
+    return logo_path, logo_path is not None
+
+def find_logo_file(team_name, league, index=None, matchers=None, normalized_name=None):
+    """Find the logo file for a team
+
+    normalized_name may be passed when it was already computed in bulk.
+    """
+    return find_logo_match(team_name, league, index, matchers, normalized_name)[0]
+
+@lru_cache(maxsize=1024)
+def _find_logo_match_standalone(team_name, league):
+    """find_logo_match without a prebuilt index, memoized per (team, league)
+
+    Lists only this league's directory, and only once per unique lookup in
+    a process that reuses these helpers.
+    """
+    index = {league: _scan_league_dir(os.path.join('logos', league))}
+    return find_logo_match(team_name, league, index)
+
+@lru_cache(maxsize=None)
+def logo_sha256(logo_path):
+    """Content hash of a logo file, computed once per path, for change detection"""
+    with open(logo_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
 
 def create_logo_mapping():
-    """Create a mapping of teams to their logo files"""
+    """Create a mapping of teams to their logo files
+
+    Returns (logo_mapping, missing_logos, fuzzy_matches). Fuzzy matches are
+    kept out of logo_mapping until someone has checked them.
+    """
     import pandas as pd
     
     # Read teams data
@@ -62,38 +197,60 @@ def create_logo_mapping():
     
     logo_mapping = {}
     missing_logos = []
+    fuzzy_matches = []
     
-    for _, team in df.iterrows():
-        team_name = team['real_team_name']
-        league = team['league'].lower()
-        
-        logo_path = find_logo_file(team_name, league)
+    # Walk each league directory once; every lookup below is in memory
+    index = index_logo_files()
+    matchers = build_partial_matchers(index)
+    
+    # Normalize every name in one columnar pass rather than per row, then
+    # iterate plain tuples (no per-row Series like iterrows)
+    rows = df[['team_id', 'real_team_name']].assign(
+        league=df['league'].str.lower(),
+        normalized_name=normalize_team_names(df['real_team_name']),
+    )
+    for team_id, team_name, league, normalized_name in rows.itertuples(index=False, name=None):
+        logo_path, is_fuzzy = find_logo_match(team_name, league, index, matchers, normalized_name)
         
-        if logo_path:
-            logo_mapping[team['team_id']] = {
+        if logo_path and is_fuzzy:
+            fuzzy_matches.append({
+                'team_id': team_id,
+                'team_name': team_name,
+                'league': league,
+                'logo_path': logo_path
+            })
+        elif logo_path:
+            logo_mapping[team_id] = {
                 'team_name': team_name,
                 'league': league,
                 'logo_path': logo_path,
-                'logo_url': f"/static/{logo_path}"
+                'logo_url': f"https://www.splitsp.lat/{Path(logo_path).as_posix()}",
+                'sha256': logo_sha256(logo_path)
             }
         else:
             missing_logos.append({
-                'team_id': team['team_id'],
+                'team_id': team_id,
                 'team_name': team_name,
                 'league': league
             })
     
-    return logo_mapping, missing_logos
+    return logo_mapping, missing_logos, fuzzy_matches
 
 def main():
     """Main function to create logo mapping"""
     print("🔍 Creating logo mapping...")
     
-    logo_mapping, missing_logos = create_logo_mapping()
+    logo_mapping, missing_logos, fuzzy_matches = create_logo_mapping()
     
     print(f"✅ Found logos for {len(logo_mapping)} teams")
+    print(f"❓ Fuzzy logo candidates for {len(fuzzy_matches)} teams (not mapped)")
     print(f"❌ Missing logos for {len(missing_logos)} teams")
     
+    if fuzzy_matches:
+        print("\nFuzzy candidates to review (see logo_mapping_fuzzy.json):")
+        for team in fuzzy_matches:
+            print(f"  {team['team_name']} ({team['league'].upper()}) -> {team['logo_path']}")
+    
     if missing_logos:
         print("\nMissing logos:")
         for team in missing_logos[:10]:  # Show first 10
@@ -101,14 +258,20 @@ def main():
         if len(missing_logos) > 10:
             print(f"  ... and {len(missing_logos) - 10} more")
     
-    # Save mapping to JSON
+    # Save mapping to JSON; encode in one shot and write once rather than
+    # letting json.dump issue a write per encoded fragment
     import json
-    with open('logo_mapping.json', 'w') as f:
-        json.dump(logo_mapping, f, indent=2)
+    with open('logo_mapping.json', 'wb') as f:
+        f.write(json.dumps(logo_mapping, indent=2).encode('utf-8'))
     
     print(f"\n💾 Logo mapping saved to logo_mapping.json")
     
-    return logo_mapping, missing_logos
+    if fuzzy_matches:
+        with open('logo_mapping_fuzzy.json', 'wb') as f:
+            f.write(json.dumps(fuzzy_matches, indent=2).encode('utf-8'))
+        print("💾 Fuzzy candidates saved to logo_mapping_fuzzy.json")
+    
+    return logo_mapping, missing_logos, fuzzy_matches
 
 if __name__ == "__main__":
     main()
@@ -104,6 +104,10 @@ CREATE INDEX idx_teams_conference_id ON teams(conference_id);
 CREATE INDEX idx_teams_stadium_id ON teams(stadium_id);
 CREATE INDEX idx_divisions_league_id ON divisions(league_id);
 CREATE INDEX idx_conferences_league_id ON conferences(league_id);
+-- Case-insensitive league lookups and the team-colors join (see migrate_add_hot_path_indexes.sql)
+CREATE INDEX idx_leagues_league_name_proper_lower ON leagues (LOWER(league_name_proper));
+CREATE INDEX idx_teams_real_team_name_league_id ON teams(real_team_name, league_id);
+CREATE INDEX idx_teams_league_id_colored ON teams(league_id) WHERE team_color_1 IS NOT NULL;
 
 
 -- Add comments for documentation
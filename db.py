@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Shared pooled database access for the maintenance scripts"""
+
+import os
+from contextlib import contextmanager
+
+from psycopg2.pool import SimpleConnectionPool
+
+_pool = None
+_env_loaded = False
+
+
+def load_env():
+    """Load .env into the environment once per process"""
+    global _env_loaded
+    if not _env_loaded:
+        # Deferred so importing a script that uses this module stays cheap
+        from dotenv import load_dotenv
+        load_dotenv(override=False)
+        _env_loaded = True
+
+
+def _get_pool():
+    """Create the connection pool on first use"""
+    global _pool
+    if _pool is None:
+        load_env()
+        _pool = SimpleConnectionPool(
+            1, 4,
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=os.getenv('DB_PORT', '5432'),
+            database=os.getenv('DB_NAME', 'sportspuff_v6'),
+            user=os.getenv('DB_USER', 'postgres'),
+            password=os.getenv('DB_PASSWORD')
+        )
+    return _pool
+
+
+@contextmanager
+def get_conn():
+    """Borrow a pooled connection, returning it to the pool afterwards"""
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
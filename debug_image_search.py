@@ -3,90 +3,114 @@
 Debug script to test image search methods
 """
 
+import codecs
 import requests
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
 
-def test_bing_search():
+# One keep-alive session shared by every search so repeated calls reuse
+# pooled connections instead of opening a new TLS session each time
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Every image-URL pattern as one alternation so the HTML is scanned once;
+# the named group tells which pattern matched
+IMAGE_URL_RE = re.compile(
+    r'"murl":"(?P<murl>[^"]+)"'
+    r'|"purl":"(?P<purl>[^"]+)"'
+    r'|data-src="(?P<data_src>[^"]+)"'
+    r'|src="(?P<src>[^"]+)"'
+)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+# Longest unmatched tail carried between chunks so a match split across a
+# chunk boundary is still found
+MAX_MATCH_CARRY = 8192
+
+def iter_image_url_matches(response, chunk_size=65536):
+    """Yield IMAGE_URL_RE matches from a streamed response as chunks arrive"""
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    buffer = ''
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        buffer += decoder.decode(chunk)
+        last_end = 0
+        for match in IMAGE_URL_RE.finditer(buffer):
+            yield match
+            last_end = match.end()
+        buffer = buffer[max(last_end, len(buffer) - MAX_MATCH_CARRY):]
+    buffer += decoder.decode(b'', final=True)
+    yield from IMAGE_URL_RE.finditer(buffer)
+
+def is_image_url(url):
+    """Whether an extracted URL looks like a usable full-size image"""
+    return url.startswith('http') and len(url) > 50 and any(ext in url.lower() for ext in IMAGE_EXTENSIONS)
+
+def test_bing_search(max_urls=10):
     """Test current Bing search method"""
     print("=" * 50)
     print("Testing Bing Image Search")
     print("=" * 50)
     
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    })
-    
     query = "fenway park stadium exterior"
     search_url = f"https://www.bing.com/images/search?q={quote_plus(query)}&form=HDRSC2&first=1&tsc=ImageHoverTitle"
     
     try:
         print(f"URL: {search_url}")
-        response = session.get(search_url, timeout=10)
-        print(f"Status Code: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type', 'N/A')}")
-        print(f"Response Length: {len(response.text)} characters")
-        
-        if response.status_code == 200:
-            # Look for image URLs in the response
-            patterns = [
-                r'"murl":"([^"]+)"',
-                r'"purl":"([^"]+)"',
-                r'data-src="([^"]+)"',
-                r'src="([^"]+)"'
-            ]
+        with SESSION.get(search_url, timeout=10, stream=True) as response:
+            print(f"Status Code: {response.status_code}")
+            print(f"Content-Type: {response.headers.get('content-type', 'N/A')}")
             
-            all_urls = []
-            for pattern in patterns:
-                matches = re.findall(pattern, response.text)
-                print(f"Pattern '{pattern}' found {len(matches)} matches")
-                all_urls.extend(matches)
-            
-            # Filter for actual image URLs
-            image_urls = []
-            for url in all_urls:
-                if any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp']):
-                    if url.startswith('http') and len(url) > 50:
+            if response.status_code == 200:
+                # Scan the body as it downloads and stop once enough image
+                # URLs are found instead of buffering the whole page
+                pattern_counts = Counter()
+                image_urls = []
+                for match in iter_image_url_matches(response):
+                    pattern_counts[match.lastgroup] += 1
+                    url = match.group(match.lastgroup)
+                    if is_image_url(url):
                         image_urls.append(url)
-            
-            print(f"Found {len(image_urls)} image URLs:")
-            for i, url in enumerate(image_urls[:3]):
-                print(f"  {i+1}: {url}")
+                        if len(image_urls) >= max_urls:
+                            break
                 
-        else:
-            print(f"Error: HTTP {response.status_code}")
+                print(f"Downloaded {response.raw.tell()} bytes")
+                for name in IMAGE_URL_RE.groupindex:
+                    print(f"Pattern '{name}' found {pattern_counts[name]} matches")
+                
+                print(f"Found {len(image_urls)} image URLs:")
+                for i, url in enumerate(image_urls[:3]):
+                    print(f"  {i+1}: {url}")
+                    
+            else:
+                print(f"Error: HTTP {response.status_code}")
             
     except Exception as e:
         print(f"Exception: {e}")
 
-def test_alternative_sources():
-    """Test alternative image sources"""
-    print("=" * 50)
-    print("Testing Alternative Sources")
-    print("=" * 50)
-    
-    # Test DuckDuckGo Images (more permissive)
+def probe_duckduckgo():
+    """Probe DuckDuckGo Images (more permissive); returns report lines"""
+    lines = ["Testing DuckDuckGo Images..."]
     try:
-        print("Testing DuckDuckGo Images...")
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
-        
         query = "fenway park stadium"
         search_url = f"https://duckduckgo.com/?q={quote_plus(query)}&t=h_&iax=images&ia=images"
         
-        response = session.get(search_url, timeout=10)
-        print(f"DuckDuckGo Status: {response.status_code}")
-        print(f"DuckDuckGo Content Length: {len(response.text)}")
+        response = SESSION.get(search_url, timeout=10)
+        lines.append(f"DuckDuckGo Status: {response.status_code}")
+        lines.append(f"DuckDuckGo Content Length: {len(response.text)}")
         
     except Exception as e:
-        print(f"DuckDuckGo Error: {e}")
-    
-    # Test Wikimedia Commons
+        lines.append(f"DuckDuckGo Error: {e}")
+    return lines
+
+def probe_wikimedia():
+    """Probe the Wikimedia Commons API; returns report lines"""
+    lines = ["Testing Wikimedia Commons API..."]
     try:
-        print("Testing Wikimedia Commons API...")
         api_url = "https://commons.wikimedia.org/w/api.php"
         params = {
             'action': 'query',
@@ -94,22 +118,44 @@ def test_alternative_sources():
             'list': 'search',
             'srsearch': 'fenway park stadium',
             'srnamespace': 6,  # File namespace
-            'srlimit': 5
+            'srlimit': 5,
+            # Only titles are reported, so skip snippets, sizes and
+            # timestamps and keep the JSON to decode small
+            'srprop': '',
+            'srinfo': ''
         }
         
-        response = requests.get(api_url, params=params, timeout=10)
-        print(f"Wikimedia Status: {response.status_code}")
+        response = SESSION.get(api_url, params=params, timeout=10)
+        lines.append(f"Wikimedia Status: {response.status_code}")
         
         if response.status_code == 200:
             data = response.json()
             if 'query' in data and 'search' in data['query']:
                 results = data['query']['search']
-                print(f"Found {len(results)} Wikimedia results:")
+                lines.append(f"Found {len(results)} Wikimedia results:")
                 for result in results[:3]:
-                    print(f"  - {result['title']}")
+                    lines.append(f"  - {result['title']}")
         
     except Exception as e:
-        print(f"Wikimedia Error: {e}")
+        lines.append(f"Wikimedia Error: {e}")
+    return lines
+
+ALTERNATIVE_SOURCE_PROBES = (probe_duckduckgo, probe_wikimedia)
+
+def test_alternative_sources():
+    """Test alternative image sources"""
+    print("=" * 50)
+    print("Testing Alternative Sources")
+    print("=" * 50)
+    
+    # Probe every source concurrently (wall time is the slowest source, not
+    # the sum) and print each report in a stable order once all are back
+    with ThreadPoolExecutor(max_workers=len(ALTERNATIVE_SOURCE_PROBES)) as executor:
+        reports = list(executor.map(lambda probe: probe(), ALTERNATIVE_SOURCE_PROBES))
+    
+    for lines in reports:
+        for line in lines:
+            print(line)
 
 if __name__ == "__main__":
     test_bing_search()
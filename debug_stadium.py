@@ -1,38 +1,43 @@
 #!/usr/bin/env python3
-"""Debug what stadium data is being returned"""
-
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-conn = psycopg2.connect(
-    host=os.getenv('DB_HOST', 'localhost'),
-    database=os.getenv('DB_NAME', 'sportspuff_v6'),
-    user=os.getenv('DB_USER', 'postgres'),
-    password=os.getenv('DB_PASSWORD')
-)
-
-cursor = conn.cursor(cursor_factory=RealDictCursor)
-cursor.execute("SELECT * FROM stadiums WHERE stadium_id = 107")
-stadium = cursor.fetchone()
-
-if stadium:
-    print("Stadium data:")
-    print(f"  stadium_id: {stadium.get('stadium_id')}")
-    print(f"  full_stadium_name: {stadium.get('full_stadium_name')}")
-    print(f"  image_name: {repr(stadium.get('image_name'))}")
-    print(f"  image_name type: {type(stadium.get('image_name'))}")
-    print(f"  image_name bool: {bool(stadium.get('image_name'))}")
-    print(f"  image (old): {repr(stadium.get('image'))}")
-    print("\nAll columns:")
-    for key in sorted(stadium.keys()):
-        print(f"  {key}: {repr(stadium[key])}")
-else:
-    print("Stadium not found")
-
-cursor.close()
-conn.close()
+"""Debug what stadium data is being returned
 
+Usage: debug_stadium.py [stadium_id] [--all]
+"""
+
+import sys
+
+from db import get_conn
+
+args = [arg for arg in sys.argv[1:] if arg != '--all']
+stadium_id = int(args[0]) if args else 107
+show_all = '--all' in sys.argv
+
+with get_conn() as conn:
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT stadium_id, full_stadium_name, image_name, image FROM stadiums WHERE stadium_id = %s",
+        (stadium_id,)
+    )
+    stadium = cursor.fetchone()
+
+    if stadium:
+        stadium_id, full_stadium_name, image_name, image = stadium
+        print("Stadium data:")
+        print(f"  stadium_id: {stadium_id}")
+        print(f"  full_stadium_name: {full_stadium_name}")
+        print(f"  image_name: {repr(image_name)}")
+        print(f"  image_name type: {type(image_name)}")
+        print(f"  image_name bool: {bool(image_name)}")
+        print(f"  image (old): {repr(image)}")
+
+        if show_all:
+            # Wide row dump only when asked for
+            cursor.execute("SELECT * FROM stadiums WHERE stadium_id = %s", (stadium_id,))
+            row = cursor.fetchone()
+            print("\nAll columns:")
+            for key, value in sorted(zip((col.name for col in cursor.description), row), key=lambda item: item[0]):
+                print(f"  {key}: {repr(value)}")
+    else:
+        print("Stadium not found")
+
+    cursor.close()
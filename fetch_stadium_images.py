@@ -9,17 +9,46 @@ Images are saved in the format: stadiums/{lower_case_league}/{lower_case_stadium
 import os
 import csv
 import requests
+import threading
 import time
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote_plus, urlparse
 from PIL import Image
 from io import BytesIO
 import json
 import re
 from typing import Dict, List, Tuple, Optional
 
+class TokenBucket:
+    """Thread-safe token bucket; the lock is never held while sleeping"""
+    
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.rate = refill_per_sec
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
 class StadiumImageFetcher:
-    def __init__(self):
+    def __init__(self, max_workers: int = 8):
         self.base_dir = "stadiums"
+        # Stadiums are fetched concurrently; each one is search + download
+        # round trips, so the crawl is I/O bound
+        self.max_workers = max_workers
         self.target_leagues = {
             'mlb': 1,
             'mls': 2, 
@@ -30,13 +59,18 @@ class StadiumImageFetcher:
             'ipl': 7
         }
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
-        # Rate limiting
+        # Rate limiting: one token bucket per host, so a throttled search
+        # engine doesn't hold up image CDN downloads
         self.request_delay = 1.0
-        self.last_request_time = 0
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
         
     def load_data(self) -> Tuple[Dict, Dict, Dict]:
         """Load teams, stadiums, and leagues data from CSV files"""
@@ -120,18 +154,17 @@ class StadiumImageFetcher:
         name = name.strip('_')  # Remove leading/trailing underscores
         return name
     
-    def rate_limit(self):
-        """Implement rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            time.sleep(self.request_delay - time_since_last)
-        self.last_request_time = time.time()
+    def rate_limit(self, url: str):
+        """Wait for a request slot for url's host (thread-safe)"""
+        host = urlparse(url).netloc
+        with self._buckets_lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(1, 1 / self.request_delay)
+        bucket.acquire()
     
     def search_stadium_images_bing(self, stadium_name: str, city: str = "") -> List[str]:
         """Search for stadium images using Bing Image Search API simulation"""
-        self.rate_limit()
-        
         # Create search query
         query_terms = [stadium_name]
         if city:
@@ -143,6 +176,8 @@ class StadiumImageFetcher:
         # Bing image search URL (we'll scrape the results page)
         search_url = f"https://www.bing.com/images/search?q={quote_plus(query)}&form=HDRSC2&first=1&tsc=ImageHoverTitle"
         
+        self.rate_limit(search_url)
+        
         try:
             response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
@@ -174,8 +209,6 @@ class StadiumImageFetcher:
     
     def search_stadium_images_google(self, stadium_name: str, city: str = "") -> List[str]:
         """Alternative search using Google Images (fallback)"""
-        self.rate_limit()
-        
         query_terms = [stadium_name]
         if city:
             query_terms.append(city)
@@ -184,6 +217,8 @@ class StadiumImageFetcher:
         query = " ".join(query_terms)
         search_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch"
         
+        self.rate_limit(search_url)
+        
         try:
             response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
@@ -210,7 +245,7 @@ class StadiumImageFetcher:
     
     def download_and_process_image(self, url: str, output_path: str) -> bool:
         """Download and process image from URL"""
-        self.rate_limit()
+        self.rate_limit(url)
         
         try:
             response = self.session.get(url, timeout=15, stream=True)
@@ -332,22 +367,33 @@ class StadiumImageFetcher:
         successful_downloads = 0
         failed_downloads = 0
         
-        for i, (stadium_key, stadium_data) in enumerate(stadium_mapping.items(), 1):
-            stadium_name = stadium_data['stadium']['full_stadium_name']
-            league = stadium_data['league']
-            
-            print(f"\n[{i}/{total_stadiums}] {league.upper()}: {stadium_name}")
-            
-            if self.fetch_stadium_image(stadium_data, league):
-                successful_downloads += 1
-            else:
-                failed_downloads += 1
-            
-            # Progress update every 10 stadiums
-            if i % 10 == 0:
-                print(f"\n📊 Progress: {i}/{total_stadiums} processed")
-                print(f"   ✅ Successful: {successful_downloads}")
-                print(f"   ❌ Failed: {failed_downloads}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_stadium_image, stadium_data, stadium_data['league']): stadium_data
+                for stadium_data in stadium_mapping.values()
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                stadium_data = futures[future]
+                stadium_name = stadium_data['stadium']['full_stadium_name']
+                league = stadium_data['league']
+                
+                try:
+                    ok = future.result()
+                except Exception as e:
+                    print(f"  Error fetching {stadium_name}: {e}")
+                    ok = False
+                print(f"\n[{i}/{total_stadiums}] {league.upper()}: {stadium_name} {'✅' if ok else '❌'}")
+                
+                if ok:
+                    successful_downloads += 1
+                else:
+                    failed_downloads += 1
+                
+                # Progress update every 10 stadiums
+                if i % 10 == 0:
+                    print(f"\n📊 Progress: {i}/{total_stadiums} processed")
+                    print(f"   ✅ Successful: {successful_downloads}")
+                    print(f"   ❌ Failed: {failed_downloads}")
         
         # Final summary
         print("\n" + "=" * 50)
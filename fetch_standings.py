@@ -5,23 +5,31 @@ Also fetches NHL playoff series records when playoffs are active.
 Runs periodically via systemd timer.
 """
 
-import psycopg2
+import csv
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from db import get_conn, load_env
+
+load_env()
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-DB_CONFIG = {
-    'host': os.getenv('DB_HOST', 'localhost'),
-    'database': os.getenv('DB_NAME', 'sportspuff_v6'),
-    'user': os.getenv('DB_USER', 'postgres'),
-    'password': os.getenv('DB_PASSWORD', 'password')
-}
+# Shared keep-alive session for every standings request in a run; requests
+# already advertises gzip/deflate, so only pooling and retries are added
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2),
+))
+# (connect, read) timeouts
+REQUEST_TIMEOUT = (3, 15)
 
 MLB_STANDINGS_URL = "https://statsapi.mlb.com/api/v1/standings?leagueId=103,104"
 
@@ -31,64 +39,113 @@ MLB_NAME_OVERRIDES = {
     "Athletics": "Oakland Athletics",
 }
 
+# (team, wins, losses) keys for each side of an MLS game payload
+MLS_GAME_SIDES = (
+    ('home_team', 'home_wins', 'home_losses'),
+    ('visitor_team', 'visitor_wins', 'visitor_losses'),
+)
+
+
+def _to_int(value, default=0):
+    """Parse an API count, treating missing/blank/'null' as default."""
+    if value in (None, '', 'null'):
+        return default
+    return int(value)
+
+
+def _league_id(cursor, league_name):
+    """Look up a league's id once per run instead of in every UPDATE."""
+    cursor.execute("SELECT league_id FROM leagues WHERE league_name_proper = %s", (league_name,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def _stage_standings(cursor, rows):
+    """COPY (api_name, real_team_name, wins, losses, league_id) rows into a
+    transaction-scoped temp table so the updates below are single
+    set-based statements over it."""
+    cursor.execute("""
+        CREATE TEMP TABLE standings_sync (
+            api_name TEXT,
+            real_team_name TEXT,
+            wins INTEGER,
+            losses INTEGER,
+            league_id INTEGER
+        ) ON COMMIT DROP
+    """)
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert("COPY standings_sync FROM STDIN WITH (FORMAT csv)", buffer)
+
 
 def fetch_mlb_standings():
     """Fetch MLB standings from the public MLB Stats API and update the database."""
     logger.info("Fetching MLB standings...")
     try:
-        response = requests.get(MLB_STANDINGS_URL, timeout=15)
+        response = SESSION.get(MLB_STANDINGS_URL, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
     except Exception as e:
         logger.error(f"Error fetching MLB standings: {e}")
         return False
 
-    conn = None
-    try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        cursor = conn.cursor()
-        updated = 0
-
-        for record_group in data.get('records', []):
-            for team_record in record_group.get('teamRecords', []):
-                team_name = team_record.get('team', {}).get('name', '')
-                wins = team_record.get('wins', 0)
-                losses = team_record.get('losses', 0)
+    records = {}
+    for record_group in data.get('records', []):
+        for team_record in record_group.get('teamRecords', []):
+            team_name = (team_record.get('team') or {}).get('name')
+            if not team_name:
+                continue
+            try:
+                records[team_name] = (_to_int(team_record.get('wins')), _to_int(team_record.get('losses')))
+            except (TypeError, ValueError):
+                logger.warning(f"Skipping {team_name}: non-numeric record "
+                               f"{team_record.get('wins')!r}-{team_record.get('losses')!r}")
 
-                if not team_name:
-                    continue
+    try:
+        # `with conn` commits once on success and rolls back on error
+        with get_conn() as conn, conn, conn.cursor() as cursor:
+            league_id = _league_id(cursor, 'MLB')
+            if league_id is None:
+                logger.warning("MLB league not found in database; skipping standings update")
+                return True
+
+            _stage_standings(cursor, [
+                (name, MLB_NAME_OVERRIDES.get(name, name), wins, losses, league_id)
+                for name, (wins, losses) in records.items()
+            ])
+
+            # One UPDATE for every team matched by exact name...
+            cursor.execute("""
+                UPDATE teams AS t SET team_wins = s.wins, team_losses = s.losses, updated_at = CURRENT_TIMESTAMP
+                FROM standings_sync s
+                WHERE t.real_team_name = s.real_team_name
+                AND t.league_id = s.league_id
+                RETURNING s.api_name
+            """)
+            matched = {row[0] for row in cursor.fetchall()}
+
+            # ...and one more for the stragglers, matched loosely by API name
+            fallback_matched = set()
+            if len(matched) < len(records):
+                cursor.execute("""
+                    UPDATE teams AS t SET team_wins = s.wins, team_losses = s.losses, updated_at = CURRENT_TIMESTAMP
+                    FROM standings_sync s
+                    WHERE s.api_name <> ALL(%s::text[])
+                    AND t.real_team_name ILIKE '%%' || s.api_name || '%%'
+                    AND t.league_id = s.league_id
+                    RETURNING s.api_name
+                """, (list(matched),))
+                fallback_matched = {row[0] for row in cursor.fetchall()}
 
-                real_name = MLB_NAME_OVERRIDES.get(team_name, team_name)
+            updated = len(matched) + len(fallback_matched)
 
-                cursor.execute("""
-                    UPDATE teams SET team_wins = %s, team_losses = %s, updated_at = CURRENT_TIMESTAMP
-                    WHERE real_team_name = %s
-                    AND league_id = (SELECT league_id FROM leagues WHERE league_name_proper = 'MLB')
-                """, (wins, losses, real_name))
-
-                if cursor.rowcount == 0:
-                    cursor.execute("""
-                        UPDATE teams SET team_wins = %s, team_losses = %s, updated_at = CURRENT_TIMESTAMP
-                        WHERE real_team_name ILIKE %s
-                        AND league_id = (SELECT league_id FROM leagues WHERE league_name_proper = 'MLB')
-                    """, (wins, losses, f"%{team_name}%"))
-
-                if cursor.rowcount > 0:
-                    updated += 1
-
-        conn.commit()
-        cursor.close()
         logger.info(f"Updated standings for {updated} MLB teams")
         return True
 
     except Exception as e:
         logger.error(f"Error updating MLB standings in database: {e}")
-        if conn:
-            conn.rollback()
         return False
-    finally:
-        if conn:
-            conn.close()
 
 
 def fetch_mls_standings():
@@ -99,7 +156,7 @@ def fetch_mls_standings():
     games = []
     for endpoint in [f'{api_base}/api/v1/scores/mls/today', f'{api_base}/api/v1/schedule/mls/today']:
         try:
-            response = requests.get(endpoint, timeout=15)
+            response = SESSION.get(endpoint, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 games.extend(data.get('scores', data.get('games', [])))
@@ -110,40 +167,42 @@ def fetch_mls_standings():
         logger.info("No MLS games data available")
         return True
 
-    conn = None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        cursor = conn.cursor()
-        updated = 0
-
-        for game in data.get('scores', data.get('games', [])):
-            for side in [('home_team', 'home_wins', 'home_losses'), ('visitor_team', 'visitor_wins', 'visitor_losses')]:
-                team_name = game.get(side[0], '')
-                wins = game.get(side[1])
-                losses = game.get(side[2])
-                if team_name and wins is not None and losses is not None:
-                    cursor.execute("""
-                        UPDATE teams SET team_wins = %s, team_losses = %s, updated_at = CURRENT_TIMESTAMP
-                        WHERE real_team_name = %s
-                        AND league_id = (SELECT league_id FROM leagues WHERE league_name_proper = 'MLS')
-                        AND (team_wins IS NULL OR team_wins != %s OR team_losses != %s)
-                    """, (wins, losses, team_name, wins, losses))
-                    if cursor.rowcount > 0:
-                        updated += 1
-
-        conn.commit()
-        cursor.close()
+        with get_conn() as conn, conn, conn.cursor() as cursor:
+            league_id = _league_id(cursor, 'MLS')
+            if league_id is None:
+                logger.warning("MLS league not found in database; skipping standings update")
+                return True
+
+            # Latest record per team across both endpoints
+            records = {}
+            for game in games:
+                for name_key, wins_key, losses_key in MLS_GAME_SIDES:
+                    team_name = game.get(name_key, '')
+                    wins = _to_int(game.get(wins_key), None)
+                    losses = _to_int(game.get(losses_key), None)
+                    if team_name and wins is not None and losses is not None:
+                        records[team_name] = (team_name, team_name, wins, losses, league_id)
+
+            updated = 0
+            if records:
+                _stage_standings(cursor, records.values())
+                cursor.execute("""
+                    UPDATE teams AS t SET team_wins = s.wins, team_losses = s.losses, updated_at = CURRENT_TIMESTAMP
+                    FROM standings_sync s
+                    WHERE t.real_team_name = s.real_team_name
+                    AND t.league_id = s.league_id
+                    AND (t.team_wins IS NULL OR t.team_wins != s.wins OR t.team_losses != s.losses)
+                    RETURNING s.real_team_name
+                """)
+                updated = len({row[0] for row in cursor.fetchall()})
+
         logger.info(f"Updated standings for {updated} MLS teams")
         return True
 
     except Exception as e:
         logger.error(f"Error updating MLS standings: {e}")
-        if conn:
-            conn.rollback()
         return False
-    finally:
-        if conn:
-            conn.close()
 
 
 if __name__ == '__main__':
@@ -217,17 +217,21 @@ def fix_all_teams():
         ('Sunrisers Hyderabad', 'IPL', 'IPL'),
     ]
     
-    # Apply all fixes
+    # Apply all fixes; the loop stays per-row for the "not found" report, so
+    # prepare the UPDATE once and only execute it per team
+    cur.execute('PREPARE fix_team(text, text, text) AS '
+                'UPDATE teams SET division_name = $1, conference_name = $2 WHERE real_team_name = $3')
     fixed_count = 0
     for team_name, division, conference in team_fixes:
-        cur.execute('UPDATE teams SET division_name = %s, conference_name = %s WHERE real_team_name = %s',
-                   (division, conference, team_name))
+        cur.execute('EXECUTE fix_team(%s, %s, %s)', (division, conference, team_name))
         if cur.rowcount > 0:
             print(f"Fixed {team_name}: {division}, {conference}")
             fixed_count += 1
         else:
             print(f"Team not found: {team_name}")
     
+    cur.execute('DEALLOCATE fix_team')
+    
     # Commit changes
     conn.commit()
     
@@ -235,11 +239,12 @@ def fix_all_teams():
     print(f"\nFixed {fixed_count} teams")
     
     # Check how many teams now have proper division/conference data
-    cur.execute('SELECT COUNT(*) FROM teams WHERE division_name IS NOT NULL AND conference_name IS NOT NULL')
-    proper_teams = cur.fetchone()[0]
-    
-    cur.execute('SELECT COUNT(*) FROM teams')
-    total_teams = cur.fetchone()[0]
+    cur.execute("""
+        SELECT COUNT(*) FILTER (WHERE division_name IS NOT NULL AND conference_name IS NOT NULL),
+               COUNT(*)
+        FROM teams
+    """)
+    proper_teams, total_teams = cur.fetchone()
     
     print(f"Teams with proper division/conference: {proper_teams}/{total_teams}")
     
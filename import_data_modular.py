@@ -6,7 +6,6 @@ Imports data from separate CSV files with proper foreign key relationships
 
 import pandas as pd
 import psycopg2
-from psycopg2.extras import RealDictCursor
 import os
 from dotenv import load_dotenv
 
@@ -364,26 +363,19 @@ def verify_import(conn):
     print("\nVerifying import...")
     
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Get counts
-        cursor.execute("SELECT COUNT(*) as count FROM leagues")
-        leagues_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM stadiums")
-        stadiums_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM conferences")
-        conferences_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM divisions")
-        divisions_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM teams")
-        teams_count = cursor.fetchone()['count']
+        cursor = conn.cursor()
         
-        cursor.execute("SELECT COUNT(*) as count FROM teams WHERE stadium_id IS NOT NULL")
-        linked_teams_count = cursor.fetchone()['count']
+        # Get counts in one round trip as a plain tuple
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM leagues),
+                   (SELECT COUNT(*) FROM stadiums),
+                   (SELECT COUNT(*) FROM conferences),
+                   (SELECT COUNT(*) FROM divisions),
+                   (SELECT COUNT(*) FROM teams),
+                   (SELECT COUNT(*) FROM teams WHERE stadium_id IS NOT NULL)
+        """)
+        (leagues_count, stadiums_count, conferences_count, divisions_count,
+         teams_count, linked_teams_count) = cursor.fetchone()
         
         # Get league breakdown
         cursor.execute("""
@@ -406,8 +398,8 @@ def verify_import(conn):
         print(f"Teams without stadiums: {teams_count - linked_teams_count}")
         
         print("\nLeague breakdown:")
-        for league in league_breakdown:
-            print(f"  {league['league_name_proper']}: {league['team_count']} teams")
+        for league_name, team_count in league_breakdown:
+            print(f"  {league_name}: {team_count} teams")
         
         return True
         
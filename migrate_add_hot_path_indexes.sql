@@ -0,0 +1,38 @@
+-- Migration: Add indexes for the hot-path page and API queries
+-- /teams, /stadiums and the api/v1 endpoints filter with ILIKE '%...%' on
+-- names and cities, league pages match LOWER(league_name_proper), and team
+-- detail pages match a slug built from real_team_name. Without these indexes
+-- every one of those lookups is a sequential scan.
+
+-- pg_trgm lets GIN indexes serve leading-wildcard ILIKE patterns
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_teams_real_team_name_trgm
+    ON teams USING gin (real_team_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_teams_city_name_trgm
+    ON teams USING gin (city_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_stadiums_full_stadium_name_trgm
+    ON stadiums USING gin (full_stadium_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_stadiums_city_name_trgm
+    ON stadiums USING gin (city_name gin_trgm_ops);
+
+-- Case-insensitive league lookups (league pages, team colors, team detail)
+CREATE INDEX IF NOT EXISTS idx_leagues_league_name_proper_lower
+    ON leagues (LOWER(league_name_proper));
+
+-- Team detail slug match; expression must stay identical to the query in app.py
+CREATE INDEX IF NOT EXISTS idx_teams_name_slug
+    ON teams (LOWER(REPLACE(real_team_name, ' ', '_')));
+
+-- Exact team lookups by name (standings refreshes, team mapping fixes),
+-- optionally narrowed by league
+CREATE INDEX IF NOT EXISTS idx_teams_real_team_name_league_id
+    ON teams (real_team_name, league_id);
+
+-- Team colors only read teams that have colors set
+CREATE INDEX IF NOT EXISTS idx_teams_league_id_colored
+    ON teams (league_id) WHERE team_color_1 IS NOT NULL;
+
+-- Join keys (already present on databases created from database_schema_modular.sql)
+CREATE INDEX IF NOT EXISTS idx_teams_league_id ON teams (league_id);
+CREATE INDEX IF NOT EXISTS idx_teams_stadium_id ON teams (stadium_id);
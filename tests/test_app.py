@@ -5,6 +5,7 @@ import json
 import os
 import subprocess
 import sys
+import time
 import unittest
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
@@ -25,11 +26,17 @@ from app import (  # noqa: E402
     LOGO_MAPPING,
     app,
     get_db_connection,
+    put_db_connection,
+    set_cached_response,
+    _api_cache,
+    _cache_ttl,
     _empty_all_scores_response,
     _fetch_all_scores_for_tz,
     _fetch_api_json,
+    _fetch_proxy_payload,
     _fetch_nfl_standings,
     _normalize_timezone,
+    _serve_stale_while_refreshing,
     _should_skip_live_api_fetch,
 )
 
@@ -168,6 +175,11 @@ class TestPageSmoke(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'id="league-date-picker"', response.data)
+        teams_query, teams_params = next(
+            (query, params) for query, params in cursor.executed if "ALL(%s::text[])" in query
+        )
+        self.assertIn("t.real_team_name <> ALL(%s::text[])", teams_query)
+        self.assertIn("Women's National Basketball League", teams_params[1])
         self.assertIn(b'id="league-timezone-select"', response.data)
         self.assertIn(b'id="league-schedule-context"', response.data)
         self.assertIn(b'id="league-schedule-freshness"', response.data)
@@ -178,15 +190,77 @@ class TestPageSmoke(unittest.TestCase):
         self.assertIn(b"function formatCricketOvers", response.data)
         self.assertIn(b"function worldCupPenaltyText", response.data)
 
-    def test_static_logo_route_redirects_to_splitsp_lat(self):
-        response = self.client.get("/static/logos/mlb/mlb_logo.png")
-
-        self.assertEqual(response.status_code, 302)
-        self.assertEqual(
-            response.headers["Location"],
-            "https://www.splitsp.lat/logos/mlb/mlb_logo.png",
+    def test_stadiums_page_reads_total_from_window_count(self):
+        cursor = FakeCursor(
+            fetchall_values=[
+                [
+                    {
+                        "stadium_id": 10,
+                        "full_stadium_name": "Gainbridge Fieldhouse",
+                        "city_name": "indianapolis",
+                        "state_name": "in",
+                        "team_count": 1,
+                        "total_count": 42,
+                    }
+                ]
+            ],
         )
 
+        with patch("app.get_db_connection", return_value=fake_connection(cursor)):
+            response = self.client.get("/stadiums?search=indy")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Showing 1 of 42 stadiums", response.data)
+        self.assertEqual(len(cursor.executed), 1)
+        self.assertIn("COUNT(*) OVER()", cursor.executed[0][0])
+
+    def test_stadiums_page_seeks_past_keyset_cursor(self):
+        rows = [
+            {
+                "stadium_id": 20 + index,
+                "full_stadium_name": f"Stadium {index:02d}",
+                "city_name": "indianapolis",
+                "state_name": "in",
+                "team_count": 0,
+                "total_count": 25,
+            }
+            for index in range(20)
+        ]
+        cursor = FakeCursor(fetchall_values=[rows])
+
+        with patch("app.get_db_connection", return_value=fake_connection(cursor)):
+            response = self.client.get("/stadiums?page=2&after_name=Lucas+Oil+Stadium&after_id=7")
+
+        self.assertEqual(response.status_code, 200)
+        query, params = cursor.executed[0]
+        self.assertIn("(s.full_stadium_name, s.stadium_id) > (%s, %s)", query)
+        self.assertEqual(params, ["Lucas Oil Stadium", 7, 20, 0])
+        self.assertIn(b"Showing 20 of 45 stadiums", response.data)
+        self.assertIn(b"after_name=Stadium+19&amp;after_id=39", response.data)
+
+    def test_teams_page_caches_league_dropdown(self):
+        def page_cursor():
+            return FakeCursor(fetchall_values=[[], [{"league_name_proper": "NBA"}, {"league_name_proper": "NFL"}]])
+
+        first, second = page_cursor(), page_cursor()
+        with (
+            patch.dict("app._api_cache", clear=True),
+            patch("app.get_db_connection", side_effect=[fake_connection(first), fake_connection(second)]),
+        ):
+            self.client.get("/teams")
+            response = self.client.get("/teams")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"NFL", response.data)
+        self.assertEqual(len(first.executed), 2)
+        self.assertEqual(len(second.executed), 1)
+
+    def test_logos_are_not_routed_through_flask(self):
+        endpoints = {rule.endpoint for rule in app.url_map.iter_rules()}
+
+        self.assertNotIn("serve_logo", endpoints)
+        self.assertEqual(self.client.get("/static/logos/mlb/mlb_logo.png").status_code, 404)
+
 
 class TestLocalApiContracts(unittest.TestCase):
     def setUp(self):
@@ -257,6 +331,48 @@ class TestLocalApiContracts(unittest.TestCase):
         self.assertEqual(data["filters"]["has_teams"], "true")
         self.assertEqual(data["stadiums"][0]["team_count"], 1)
 
+    def test_team_colors_are_cached_per_league(self):
+        cursor = FakeCursor(
+            fetchone_values=[
+                {
+                    "color_map": {
+                        "Indiana Pacers": {"color_1": "#002D62", "color_2": "#FDBB30", "color_3": "#BEC0C2"},
+                    }
+                }
+            ],
+        )
+
+        with (
+            patch.dict("app._api_cache", clear=True),
+            patch("app.get_db_connection", return_value=fake_connection(cursor)) as db,
+        ):
+            first = self.client.get("/api/team-colors/NBA")
+            second = self.client.get("/api/team-colors/nba")
+            revalidated = self.client.get("/api/team-colors/nba", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(first.get_json(), second.get_json())
+        self.assertEqual(second.get_json()["Indiana Pacers"]["color_2"], "#FDBB30")
+        self.assertEqual(first.headers["ETag"], second.headers["ETag"])
+        self.assertIn("max-age=60", first.headers["Cache-Control"])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertIn("LOWER(l.league_name_proper) = %s", cursor.executed[0][0])
+        self.assertEqual(cursor.executed[0][1], ("nba",))
+        db.assert_called_once()
+
+    def test_team_colors_for_unknown_league_are_not_cached(self):
+        cursor = FakeCursor(fetchone_values=[{"color_map": None}])
+
+        with (
+            patch.dict("app._api_cache", clear=True),
+            patch("app.get_db_connection", return_value=fake_connection(cursor)),
+        ):
+            response = self.client.get("/api/team-colors/not-a-league")
+            cached_keys = list(_api_cache)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {})
+        self.assertEqual(cached_keys, [])
+
     def test_api_v1_database_failure_returns_500(self):
         with patch("app.get_db_connection", return_value=None):
             response = self.client.get("/api/v1/teams")
@@ -298,7 +414,7 @@ class TestLiveDataProxyHelpers(unittest.TestCase):
         self.assertIn("cycling", data)
         refresh.assert_called_once()
 
-    @patch("app.requests.get")
+    @patch("app.SESSION.get")
     def test_api_json_retries_fallback_host_after_primary_502(self, mock_get):
         primary = MagicMock(status_code=502, text="bad gateway")
         fallback = MagicMock(status_code=200)
@@ -310,8 +426,9 @@ class TestLiveDataProxyHelpers(unittest.TestCase):
         self.assertEqual(data["games"][0]["game_id"], "wc1")
         self.assertEqual(mock_get.call_args_list[0].args[0], "https://api.sportspuff.net/api/v1/schedule/wc/2026-06-11?tz=pt")
         self.assertEqual(mock_get.call_args_list[1].args[0], "https://api-dev.sportspuff.net/api/v1/schedule/wc/2026-06-11?tz=pt")
+        self.assertEqual(mock_get.call_args_list[0].kwargs["timeout"], (3.05, 15))
 
-    @patch("app.requests.get")
+    @patch("app.SESSION.get")
     def test_all_scores_fetch_uses_fallback_for_wc_schedule(self, mock_get):
         def response_for(url, **kwargs):
             if "api.sportspuff.net/api/v1/schedule/wc/" in url:
@@ -866,7 +983,7 @@ class TestTournamentThemeAssets(unittest.TestCase):
         mock_cache.assert_called_once_with("world_cup_bracket", "schedule")
         self.assertEqual(mock_set_cache.call_args.args[0], "world_cup_bracket")
 
-    @patch("app.requests.get")
+    @patch("app.SESSION.get")
     def test_proxy_wc_season_info_uses_backend_payload(self, mock_get):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -1152,6 +1269,114 @@ class TestTournamentThemeAssets(unittest.TestCase):
         mock_fetch.assert_called_once_with("/api/v1/schedule/cycling/2026-07-15?tz=pt", timeout=20)
         self.assertEqual(mock_set_cache.call_args.args[0], "schedule:cycling:2026-07-15:pt")
 
+    def test_cached_scores_are_encoded_once_per_cache_write(self):
+        cache_key = "scores:mlb:2026-07-15:pt"
+        client = app.test_client()
+
+        payload = {"date": "2026-07-15", "scores": [{"game_id": "1"}]}
+
+        with patch.dict("app._api_cache", clear=True), patch.dict("app._encoded_responses", clear=True):
+            set_cached_response(cache_key, payload)
+            first = client.get("/api/proxy/scores/mlb/2026-07-15?tz=pt")
+            with patch("app.json.dumps", wraps=json.dumps) as dumps:
+                second = client.get("/api/proxy/scores/mlb/2026-07-15?tz=pt")
+
+        self.assertNotIn(payload, [call.args[0] for call in dumps.call_args_list if call.args])
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(second.get_json()["scores"][0]["game_id"], "1")
+        self.assertEqual(first.headers["ETag"], second.headers["ETag"])
+
+    def test_concurrent_proxy_misses_share_one_upstream_fetch(self):
+        import threading
+
+        release = threading.Event()
+        payload = {"date": "2026-07-15", "scores": []}
+
+        def slow_fetch(path, timeout):
+            release.wait(5)
+            return payload
+
+        results = []
+        with (
+            patch.dict("app._api_cache", clear=True),
+            patch("app._fetch_api_json", side_effect=slow_fetch) as mock_fetch,
+        ):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        _fetch_proxy_payload("scores:mlb:today:pt", "scores", "/api/v1/scores/mlb/today?tz=pt")
+                    )
+                )
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            # Let every thread reach the in-flight check before the leader returns
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(results, [payload] * 3)
+        mock_fetch.assert_called_once()
+
+    def test_proxy_scores_sets_cache_headers_and_honours_etag(self):
+        cached_response = {"date": "2026-07-15", "scores": [{"game_id": "stage-11"}]}
+        client = app.test_client()
+
+        with patch("app.get_cached_response", return_value=cached_response):
+            first = client.get("/api/proxy/scores/cycling/2026-07-15?tz=pt")
+            second = client.get(
+                "/api/proxy/scores/cycling/2026-07-15?tz=pt",
+                headers={"If-None-Match": first.headers["ETag"]},
+            )
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("max-age=5", first.headers["Cache-Control"])
+        self.assertIn("public", first.headers["Cache-Control"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b"")
+
+    @patch("app._fetch_api_json")
+    def test_proxy_scores_serves_stale_cache_while_refreshing(self, mock_fetch):
+        stale_response = {"date": "2026-07-15", "scores": [{"game_id": "old-stage"}]}
+
+        def cached(key, cache_type, allow_expired=False, max_stale=None):
+            return stale_response if allow_expired else None
+
+        with (
+            patch.dict(os.environ, {"DISABLE_BACKGROUND_CACHE_REFRESH": "0"}),
+            patch("app.get_cached_response", side_effect=cached),
+            patch("app._refresh_cache_async") as refresh,
+        ):
+            response = app.test_client().get("/api/proxy/scores/cycling/2026-07-15?tz=pt")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["scores"][0]["game_id"], "old-stage")
+        mock_fetch.assert_not_called()
+        refresh.assert_called_once()
+        self.assertEqual(refresh.call_args.args[0], "scores:cycling:2026-07-15:pt")
+
+    def test_stale_cache_is_not_served_past_max_staleness(self):
+        cache_key = "scores:cycling:stale-cap-test:pt"
+        ttl = _cache_ttl["scores"]
+        stale_payload = {"scores": []}
+        try:
+            for age, expected in ((ttl * 2 - 1, stale_payload), (ttl * 2 + 1, None)):
+                _api_cache[cache_key] = (
+                    stale_payload,
+                    datetime.now(timezone.utc) - timedelta(seconds=age),
+                )
+                with (
+                    patch.dict(os.environ, {"DISABLE_BACKGROUND_CACHE_REFRESH": "0"}),
+                    patch("app._refresh_cache_async") as refresh,
+                ):
+                    served = _serve_stale_while_refreshing(cache_key, "scores", "/unused")
+                self.assertEqual(served, expected)
+                self.assertEqual(refresh.called, expected is not None)
+        finally:
+            _api_cache.pop(cache_key, None)
+
     @patch("app._fetch_api_json_from_candidates")
     def test_proxy_giro_uses_giro_d_italia_backend_route(self, mock_fetch):
         mock_fetch.return_value = {
@@ -1498,7 +1723,7 @@ class TestTournamentThemeAssets(unittest.TestCase):
         self.assertIn("visitor_shootout_score", template)
 
     @patch("app._should_skip_live_api_fetch", return_value=False)
-    @patch("app.requests.get")
+    @patch("app.SESSION.get")
     def test_fetch_nfl_standings_keys_by_name_and_abbreviation(self, mock_get, _mock_skip):
         response = MagicMock()
         response.status_code = 200
@@ -1515,7 +1740,7 @@ class TestTournamentThemeAssets(unittest.TestCase):
         self.assertEqual(records["BUF"], {"wins": 13, "losses": 4, "ties": 0})
 
     @patch("app._fetch_api_json")
-    @patch("app.requests.get")
+    @patch("app.SESSION.get")
     def test_mlc_season_info_falls_back_to_schedule_and_standings_when_endpoint_is_stale(self, mock_get, mock_fetch_api_json):
         response = MagicMock()
         response.raise_for_status.return_value = None
@@ -1545,6 +1770,7 @@ class TestDatabaseAndConfig(unittest.TestCase):
         for key in ["host", "database", "user", "password"]:
             self.assertIn(key, DB_CONFIG)
 
+    @patch("app._db_pool", None)
     @patch("psycopg2.connect")
     def test_database_connection_success(self, mock_connect):
         mock_conn = MagicMock()
@@ -1553,12 +1779,34 @@ class TestDatabaseAndConfig(unittest.TestCase):
         self.assertEqual(get_db_connection(), mock_conn)
         mock_connect.assert_called_once()
 
+    @patch("app._db_pool", None)
     @patch("psycopg2.connect")
     def test_database_connection_failure(self, mock_connect):
         mock_connect.side_effect = psycopg2.Error("Connection failed")
 
         self.assertIsNone(get_db_connection())
 
+    def test_pooled_connections_are_read_only_autocommit(self):
+        pool = MagicMock()
+        pool.getconn.return_value.autocommit = False
+        with patch("app._db_pool", pool):
+            conn = get_db_connection()
+
+        conn.set_session.assert_called_once_with(readonly=True, autocommit=True)
+
+    def test_database_connections_return_to_pool_at_request_teardown(self):
+        pool = MagicMock()
+        with patch("app._db_pool", pool):
+            with app.test_request_context("/teams"):
+                conn = get_db_connection()
+            self.assertIs(conn, pool.getconn.return_value)
+            pool.putconn.assert_called_once_with(conn)
+
+            released = get_db_connection()
+            put_db_connection(released)
+
+        self.assertEqual(pool.putconn.call_count, 2)
+
     def test_logo_mapping_is_dictionary(self):
         self.assertIsInstance(LOGO_MAPPING, dict)
 
@@ -5,58 +5,172 @@ Only updates abbreviations if provided by the API - never generates/makes up abb
 Matches teams by teamCity + teamName to real_team_name or full_team_name
 """
 
+import json
 import os
+import random
+import string
 import sys
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from dotenv import load_dotenv
+from psycopg2.extras import execute_values
+
+from db import load_env
 
 # Load environment variables
-load_dotenv()
+load_env()
+
+# The API response is cached on disk so repeated runs (e.g. while iterating
+# on matching) don't spend RapidAPI quota; set NFL_API_TTL_SEC=0 to disable
+NFL_API_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'nfl_teams_api.json')
+NFL_API_TTL_SEC = int(os.getenv('NFL_API_TTL_SEC', '300'))
+
+TANK01_HOST = "tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com"
+
+# Monotonic time before which RapidAPI said the quota is exhausted
+_rate_limited_until = 0.0
+
+def _note_rate_limit(response, *args, **kwargs):
+    """Response hook: remember when the quota resets once it hits zero"""
+    global _rate_limited_until
+    remaining = response.headers.get('X-RateLimit-Requests-Remaining')
+    reset = response.headers.get('X-RateLimit-Requests-Reset')
+    if remaining == '0' and reset and reset.isdigit():
+        _rate_limited_until = time.monotonic() + int(reset)
+
+def _wait_for_rate_limit():
+    """Sleep out a known quota reset, with jitter so parallel runs spread out"""
+    delay = _rate_limited_until - time.monotonic()
+    if delay > 0:
+        print(f"RapidAPI quota exhausted, waiting {delay:.0f}s for reset")
+        time.sleep(delay + random.uniform(0, 0.5))
+
+# One keep-alive session for RapidAPI, with the auth headers set once.
+# Transient failures (including free-tier 429s) back off exponentially and
+# honour Retry-After instead of ending the run
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+SESSION.hooks['response'].append(_note_rate_limit)
+RAPIDAPI_KEY = os.getenv('RAPIDAPI_KEY')
+SESSION.headers.update({
+    "x-rapidapi-key": RAPIDAPI_KEY or '',
+    "x-rapidapi-host": TANK01_HOST,
+})
+# (connect, read) timeouts
+REQUEST_TIMEOUT = (3, 15)
+
+# An NFL row from the teams table, in fetch_db_nfl_teams column order
+DbTeam = namedtuple('DbTeam', 'team_id real_team_name full_team_name team_abbreviation')
+
+# The only fields read from each API team
+API_TEAM_FIELDS = ('teamAbv', 'teamCity', 'teamName')
+
+_conn = None
 
 def get_db_connection():
-    """Get database connection from environment variables"""
+    """Get database connection from environment variables
+
+    The connection is reused for the life of the process until it is closed.
+    """
+    global _conn
+    if _conn is not None and not _conn.closed:
+        return _conn
     try:
-        conn = psycopg2.connect(
+        _conn = psycopg2.connect(
             host=os.getenv('DB_HOST', 'localhost'),
             port=os.getenv('DB_PORT', '5432'),
             database=os.getenv('DB_NAME', 'sportspuff_v6'),
             user=os.getenv('DB_USER', 'postgres'),
             password=os.getenv('DB_PASSWORD', '')
         )
-        return conn
+        return _conn
     except Exception as e:
         print(f"Error connecting to database: {e}")
         return None
 
-def fetch_nfl_teams_from_api():
-    """Fetch NFL teams from Tank01 API"""
-    url = "https://tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com/getNFLTeams"
+def _read_cached_api_teams():
+    """Return cached API teams if the cache file is younger than the TTL"""
+    if NFL_API_TTL_SEC <= 0:
+        return None
+    try:
+        if time.time() - os.path.getmtime(NFL_API_CACHE_PATH) > NFL_API_TTL_SEC:
+            return None
+        with open(NFL_API_CACHE_PATH, 'rb') as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _write_cached_api_teams(teams):
+    """Atomically replace the API cache file"""
+    if NFL_API_TTL_SEC <= 0:
+        return
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(NFL_API_CACHE_PATH))
+        with os.fdopen(fd, 'w') as f:
+            json.dump(teams, f)
+        os.replace(tmp_path, NFL_API_CACHE_PATH)
+    except OSError as e:
+        print(f"Could not cache NFL API response: {e}")
+
+def fetch_nfl_teams_from_api(strict=False):
+    """Fetch NFL teams from Tank01 API (served from the disk cache within the TTL)
+
+    Network, HTTP and JSON decoding errors are reported and yield an empty
+    list, or are raised when strict is set. Anything else is a bug and
+    propagates rather than being mistaken for an API outage. A missing
+    RAPIDAPI_KEY raises RuntimeError instead of sending unauthenticated
+    requests.
+    """
+    cached = _read_cached_api_teams()
+    if cached is not None:
+        print(f"Using cached API response from {NFL_API_CACHE_PATH}")
+        return cached
+    
+    if not RAPIDAPI_KEY:
+        raise RuntimeError("RAPIDAPI_KEY is not set; add it to the environment or .env")
+    
+    url = f"https://{TANK01_HOST}/getNFLTeams"
     querystring = {
         "sortBy": "standings",
         "rosters": "false",
         "schedules": "false",
-        "topPerformers": "true",
-        "teamStats": "true",
-        "teamStatsSeason": "2024"
-    }
-    headers = {
-        "x-rapidapi-key": os.getenv('RAPIDAPI_KEY', ''),
-        "x-rapidapi-host": "tank01-nfl-live-in-game-real-time-statistics-nfl.p.rapidapi.com"
+        # Only the team identity fields are used; stats and top performers
+        # make up most of the payload
+        "topPerformers": "false",
+        "teamStats": "false"
     }
     
     try:
-        response = requests.get(url, headers=headers, params=querystring)
+        _wait_for_rate_limit()
+        response = SESSION.get(url, params=querystring, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
         if data.get('statusCode') == 200 and 'body' in data:
-            return data['body']
+            teams = [{field: team[field] for field in API_TEAM_FIELDS if field in team}
+                     for team in data['body']]
+            _write_cached_api_teams(teams)
+            return teams
         else:
             print(f"Unexpected API response: {data}")
             return []
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if strict:
+            raise
         print(f"Error fetching NFL teams from API: {e}")
         return []
 
@@ -66,80 +180,176 @@ def normalize_team_name(city, team_name):
     full_name = f"{city} {team_name}".strip()
     return full_name
 
-def match_team(api_team, db_teams):
+# Short city forms an API may use, mapped to the city as stored in the
+# database, so matching can compare canonical names for equality
+CITY_ALIASES = {
+    'la': 'los angeles',
+    'ny': 'new york',
+    'nyc': 'new york',
+    'sf': 'san francisco',
+    'kc': 'kansas city',
+    'tb': 'tampa bay',
+    'ne': 'new england',
+    'gb': 'green bay',
+    'lv': 'las vegas',
+}
+
+# Translation table deleting punctuation, so "St. Louis" and "St Louis" agree
+_PUNCTUATION = str.maketrans('', '', string.punctuation)
+
+def normalize_name(name):
+    """Lowercase, drop punctuation and collapse whitespace in one pass each"""
+    return ' '.join(name.translate(_PUNCTUATION).lower().split())
+
+def canonical_team_key(city, nickname):
+    """Canonical "city nickname" key with city aliases expanded
+
+    Both parts must already be normalize_name()d.
+    """
+    return f"{CITY_ALIASES.get(city, city)} {nickname}"
+
+def build_team_index(db_teams):
+    """Index database teams once for match_team
+
+    Names are stripped and lowercased here, once per team. Returns an
+    exact-name dict keyed by lowercased real/full team name, and a dict
+    keyed by canonical_team_key for every city/nickname split of those names
+    (so multi-word cities and nicknames both resolve), and a last-word
+    nickname dict of (canonical cities, team) candidates for match_team to
+    confirm against the API city.
+    """
+    by_name = {}
+    by_key = {}
+    by_nickname = {}
+    for db_team in db_teams:
+        real_name = db_team.real_team_name
+        full_name = db_team.full_team_name
+        # full_team_name usually repeats real_team_name; normalize it only once
+        names = (real_name,) if full_name == real_name else (real_name, full_name)
+        for name in names:
+            words = normalize_name(name or '').split()
+            if not words:
+                continue
+            by_name.setdefault(' '.join(words), db_team)
+            if len(words) > 1:
+                # Every city prefix, since the nickname may span several words
+                cities = frozenset(CITY_ALIASES.get(city, city) for city in
+                                   (' '.join(words[:split]) for split in range(1, len(words))))
+                by_nickname.setdefault(words[-1], []).append((cities, db_team))
+            for split in range(1, len(words)):
+                key = canonical_team_key(' '.join(words[:split]), ' '.join(words[split:]))
+                by_key.setdefault(key, db_team)
+    return by_name, by_key, by_nickname
+
+def match_team(api_team, db_teams, index=None):
     """Match API team to database team"""
-    api_full_name = normalize_team_name(api_team['teamCity'], api_team['teamName'])
-    api_abbrev = api_team.get('teamAbv', '').strip()
+    api_abbrev = (api_team.get('teamAbv') or '').strip()
     
     if not api_abbrev:
         return None, None
     
-    # Try to match by real_team_name or full_team_name
-    for db_team in db_teams:
-        db_real_name = (db_team.get('real_team_name') or '').strip()
-        db_full_name = (db_team.get('full_team_name') or '').strip()
-        
-        # Exact match
-        if (db_real_name.lower() == api_full_name.lower() or 
-            db_full_name.lower() == api_full_name.lower()):
-            return db_team['team_id'], api_abbrev
-        
-        # Try matching just the team name part (e.g., "Patriots")
-        if api_team['teamName'].lower() in db_real_name.lower() or api_team['teamName'].lower() in db_full_name.lower():
-            # Also check if city matches
-            if api_team['teamCity'].lower() in db_real_name.lower() or api_team['teamCity'].lower() in db_full_name.lower():
-                return db_team['team_id'], api_abbrev
+    if index is None:
+        index = build_team_index(db_teams)
+    by_name, by_key, by_nickname = index
+    
+    # Exact match on real_team_name or full_team_name, then on the
+    # canonical city + nickname (e.g. "LA Rams" -> "Los Angeles Rams"),
+    # then on the nickname's last word when the canonical city also agrees
+    # (e.g. "Washington" + "Football Team" -> "Washington Team")
+    api_name = normalize_name(api_team.get('teamName') or '')
+    if not api_name:
+        # Every index is keyed on the nickname, so nothing can match
+        return None, None
+    api_city = normalize_name(api_team.get('teamCity') or '')
+    db_team = (by_name.get(f"{api_city} {api_name}".strip()) or
+               by_key.get(canonical_team_key(api_city, api_name)))
+    if db_team:
+        return db_team.team_id, api_abbrev
+    
+    canonical_city = CITY_ALIASES.get(api_city, api_city)
+    candidates = {candidate.team_id: candidate
+                  for cities, candidate in by_nickname.get(api_name.rsplit(' ', 1)[-1], ())
+                  if canonical_city in cities}
+    if len(candidates) == 1:
+        return next(iter(candidates)), api_abbrev
     
     return None, None
 
-def update_team_abbreviations(conn, api_teams):
-    """Update team abbreviations in database"""
-    cursor = conn.cursor(cursor_factory=RealDictCursor)
-    
-    # Get all NFL teams from database
-    cursor.execute("""
-        SELECT team_id, real_team_name, full_team_name, team_abbreviation
-        FROM teams
-        WHERE league = 'NFL' OR league_name = 'NFL'
-        ORDER BY team_id
-    """)
-    db_teams = cursor.fetchall()
+def fetch_db_nfl_teams(conn):
+    """Get all NFL teams from database"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT team_id, real_team_name, full_team_name, team_abbreviation
+            FROM teams
+            WHERE league = 'NFL' OR league_name = 'NFL'
+            ORDER BY team_id
+        """)
+        return [DbTeam._make(row) for row in cursor]
+
+def connect_and_fetch_db_nfl_teams():
+    """Open a connection and load the NFL teams; returns (conn, db_teams)"""
+    conn = get_db_connection()
+    if not conn:
+        return None, None
+    try:
+        return conn, fetch_db_nfl_teams(conn)
+    except Exception:
+        conn.close()
+        raise
+
+def update_team_abbreviations(conn, api_teams, db_teams=None):
+    """Update team abbreviations in database
+
+    Runs inside the caller's transaction; the caller commits.
+    """
+    if db_teams is None:
+        db_teams = fetch_db_nfl_teams(conn)
     
     print(f"Found {len(db_teams)} NFL teams in database")
     print(f"Found {len(api_teams)} teams from API")
     
-    updated_count = 0
     not_found = []
     
+    # team_id -> API abbreviation; a later API team matching the same row wins
+    new_abbrevs = {}
+    team_index = build_team_index(db_teams)
     for api_team in api_teams:
-        team_id, abbrev = match_team(api_team, db_teams)
+        team_id, abbrev = match_team(api_team, db_teams, team_index)
         
         if team_id and abbrev:
-            # Check if abbreviation is different
-            cursor.execute("""
-                SELECT team_abbreviation FROM teams WHERE team_id = %s
-            """, (team_id,))
-            current_abbrev = cursor.fetchone()
-            current_abbrev = current_abbrev['team_abbreviation'] if current_abbrev else None
-            
-            if current_abbrev != abbrev:
-                cursor.execute("""
-                    UPDATE teams 
-                    SET team_abbreviation = %s, updated_at = CURRENT_TIMESTAMP
-                    WHERE team_id = %s
-                """, (abbrev, team_id))
-                team_name = next((t['real_team_name'] for t in db_teams if t['team_id'] == team_id), 'Unknown')
-                print(f"Updated {team_name} (ID: {team_id}): {current_abbrev} -> {abbrev}")
-                updated_count += 1
-            else:
-                team_name = next((t['real_team_name'] for t in db_teams if t['team_id'] == team_id), 'Unknown')
-                print(f"No change for {team_name} (ID: {team_id}): {abbrev}")
+            new_abbrevs[team_id] = abbrev
         else:
-            api_full = normalize_team_name(api_team['teamCity'], api_team['teamName'])
-            not_found.append(f"{api_full} ({api_team.get('teamAbv', 'N/A')})")
+            api_full = normalize_team_name(api_team.get('teamCity') or '', api_team.get('teamName') or '')
+            not_found.append(f"{api_full} ({api_team.get('teamAbv') or 'N/A'})")
+    
+    # Diff against the abbreviations already loaded so a no-op run sends no
+    # UPDATE at all; the SQL guard still protects against a concurrent change
+    teams_by_id = {t.team_id: t for t in db_teams}
+    changed = [(team_id, abbrev) for team_id, abbrev in new_abbrevs.items()
+               if teams_by_id[team_id].team_abbreviation != abbrev]
     
-    conn.commit()
-    cursor.close()
+    # One statement for every changed team; rows whose abbreviation already
+    # matches are left alone so updated_at only moves on a real change
+    updated_ids = set()
+    if changed:
+        with conn.cursor() as cursor:
+            updated_ids = {row[0] for row in execute_values(cursor, """
+                UPDATE teams t
+                SET team_abbreviation = v.abbrev, updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS v(team_id, abbrev)
+                WHERE t.team_id = v.team_id
+                  AND t.team_abbreviation IS DISTINCT FROM v.abbrev
+                RETURNING t.team_id
+            """, changed, fetch=True)}
+    
+    for team_id, abbrev in new_abbrevs.items():
+        db_team = teams_by_id[team_id]
+        if team_id in updated_ids:
+            print(f"Updated {db_team.real_team_name} (ID: {team_id}): "
+                  f"{db_team.team_abbreviation} -> {abbrev}")
+        else:
+            print(f"No change for {db_team.real_team_name} (ID: {team_id}): {abbrev}")
+    updated_count = len(updated_ids)
     
     print(f"\nSummary:")
     print(f"  Updated: {updated_count} teams")
@@ -152,26 +362,42 @@ def update_team_abbreviations(conn, api_teams):
 
 def main():
     """Main function"""
-    print("Fetching NFL teams from Tank01 API...")
-    api_teams = fetch_nfl_teams_from_api()
+    # The API call and the database connect + team query are independent
+    # I/O waits, so overlap them
+    print("Fetching NFL teams from Tank01 API and loading NFL teams from database...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(fetch_nfl_teams_from_api)
+        db_future = executor.submit(connect_and_fetch_db_nfl_teams)
+        try:
+            api_teams = api_future.result()
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            api_teams = []
+        try:
+            conn, db_teams = db_future.result()
+        except Exception as e:
+            print(f"Error loading teams from database: {e}")
+            sys.exit(1)
     
     if not api_teams:
         print("No teams found from API. Exiting.")
+        if conn:
+            conn.close()
         sys.exit(1)
     
-    print(f"Connecting to database...")
-    conn = get_db_connection()
     if not conn:
         print("Failed to connect to database. Exiting.")
         sys.exit(1)
     
     try:
-        print("Updating team abbreviations...")
-        updated = update_team_abbreviations(conn, api_teams)
+        # The team read and the update share one transaction, committed once
+        # on success and rolled back by the context manager on error
+        with conn:
+            print("Updating team abbreviations...")
+            updated = update_team_abbreviations(conn, api_teams, db_teams)
         print(f"\nSuccessfully updated {updated} team abbreviations")
     except Exception as e:
         print(f"Error updating abbreviations: {e}")
-        conn.rollback()
         sys.exit(1)
     finally:
         conn.close()
@@ -69,6 +69,8 @@ def warm_cache():
     
     success_count = 0
     error_count = 0
+    # One keep-alive connection to the local app for the whole run
+    session = requests.Session()
     
     # During game hours, prioritize scores (they change frequently)
     # During off-hours, prioritize schedules (scores are less likely to change)
@@ -80,7 +82,7 @@ def warm_cache():
                 try:
                     scores_url = f"{BASE_URL}/api/proxy/scores/{league}/today?tz={tz}"
                     logger.debug(f"Warming scores cache: {league} ({tz})")
-                    response = requests.get(scores_url, timeout=30)
+                    response = session.get(scores_url, timeout=30)
                     if response.status_code == 200:
                         success_count += 1
                     else:
@@ -94,7 +96,7 @@ def warm_cache():
                 try:
                     schedule_url = f"{BASE_URL}/api/proxy/schedule/{league}/today?tz={tz}"
                     logger.debug(f"Warming schedule cache: {league} ({tz})")
-                    response = requests.get(schedule_url, timeout=30)
+                    response = session.get(schedule_url, timeout=30)
                     if response.status_code == 200:
                         success_count += 1
                     else:
@@ -111,7 +113,7 @@ def warm_cache():
                 try:
                     schedule_url = f"{BASE_URL}/api/proxy/schedule/{league}/today?tz={tz}"
                     logger.debug(f"Warming schedule cache: {league} ({tz})")
-                    response = requests.get(schedule_url, timeout=30)
+                    response = session.get(schedule_url, timeout=30)
                     if response.status_code == 200:
                         success_count += 1
                     else:
@@ -125,7 +127,7 @@ def warm_cache():
                 try:
                     scores_url = f"{BASE_URL}/api/proxy/scores/{league}/today?tz={tz}"
                     logger.debug(f"Warming scores cache: {league} ({tz})")
-                    response = requests.get(scores_url, timeout=30)
+                    response = session.get(scores_url, timeout=30)
                     if response.status_code == 200:
                         success_count += 1
                     else: